@@ -2,19 +2,42 @@
 
 # Zuerst werden nur die grundlegenden Module importiert, die keine hardware-abhängigen Importe enthalten
 from mcp2221_io.new_core import get_logger, get_config
-from mcp2221_io.const import MCP2221, FT232H, setup_hardware
+from mcp2221_io.const import setup_hardware
 
-# Hardware-Konfiguration laden und konstanten setzen
-config = get_config()
-logger = get_logger()
-hw_str = setup_hardware(config.get_value("hardware", {}), logger)
+# Hardware-abhängige Module (board, digitalio, paho) erst beim ersten Zugriff importieren
+_LAZY_IMPORTS = {
+    'IODevice': 'mcp2221_io.new_io_device',
+    'IOActor': 'mcp2221_io.new_io_actor',
+    'IOSensor': 'mcp2221_io.new_io_sensor',
+    'IOController': 'mcp2221_io.new_io_controller',
+    'MQTTClient': 'mcp2221_io.new_mqtt',
+}
 
-# Nun können hardware-abhängige Module importiert werden
-from mcp2221_io.new_io_device import IODevice
-from mcp2221_io.new_io_actor import IOActor
-from mcp2221_io.new_io_sensor import IOSensor
-from mcp2221_io.new_io_controller import IOController
-from mcp2221_io.new_mqtt import MQTTClient
+def _load_hardware():
+    # Hardware-Konfiguration laden und Auswahl protokollieren
+    return setup_hardware(get_config().get_value("hardware", {}), get_logger())
 
-# Export des aktuellen Hardware-Typs für externe Module
-__hw_type__ = hw_str
\ No newline at end of file
+# Konfiguration und Hardware erst beim ersten Zugriff laden, damit der Import des Pakets
+# nicht an einer ungültigen config.yaml scheitert (ConfigError tritt beim Zugriff auf)
+_LAZY_VALUES = {
+    'config': get_config,
+    'logger': get_logger,
+    'hardware': _load_hardware,
+    'hw_str': lambda: __getattr__('hardware').name,
+    # Export des aktuellen Hardware-Typs für externe Module
+    '__hw_type__': lambda: __getattr__('hardware').name,
+}
+
+def __getattr__(name):
+    factory = _LAZY_VALUES.get(name)
+    if factory is not None:
+        value = factory()
+        globals()[name] = value
+        return value
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Weitere Zugriffe ohne __getattr__
+    return value
\ No newline at end of file
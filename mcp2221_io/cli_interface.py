@@ -4,11 +4,50 @@
 import time
 import os
 import sys
-import copy
 import select
+import threading
+import json
 from termcolor import colored
 from mcp2221_io import InputEvent
-import pprint
+
+def _override(base, path, value):
+    """Gibt eine Kopie von base zurück, in der der Wert unter path (Tupel von Schlüsseln) ersetzt ist.
+    
+    Nur die Dicts entlang des Pfads werden kopiert, alle übrigen Teilbäume werden geteilt.
+    """
+    key = path[0]
+    if len(path) == 1:
+        return {**base, key: value}
+    child = base.get(key)
+    return {**base, key: _override(child if isinstance(child, dict) else {}, path[1:], value)}
+
+# Anzeige-Text je letztem Topic-Level
+_SUFFIX_LABELS = {"set": " [COMMAND]", "state": " [STATE]"}
+
+def classify_topic(topic, base_prefix):
+    """Ermittelt Nachrichtentyp und Zielgerät eines MQTT-Topics als Anzeige-Text (z.B. ' [STATE] [Device=x]')
+    
+    :param base_prefix: Basis-Topic inklusive abschließendem '/' (einmalig vom Aufrufer gebildet)
+    """
+    head, _, tail = topic.rpartition('/')
+    msg_type = ""
+    if '/' in head:  # Mindestens drei Ebenen
+        msg_type = _SUFFIX_LABELS.get(tail) or (" [STATUS]" if "status" in tail else "")
+    
+    # Target-Gerät identifizieren (wenn vorhanden)
+    target = ""
+    if topic.startswith(base_prefix):
+        target = f" [Device={topic[len(base_prefix):].partition('/')[0]}]"
+    return msg_type + target
+
+_DIAGNOSE_MENU = "\n".join((
+    "\n--- Diagnose-Menü ---",
+    "c: Konfiguration anzeigen",
+    "l: Live-Logging anzeigen",
+    "f: Force-Update für alle Sensoren ausführen",
+    "r: Alle Zustände neu veröffentlichen",
+    "q: Zurück zum Hauptmenü",
+))
 
 def format_debug_parameter(key, value, indent=0):
     prefix = "  " * indent
@@ -33,15 +72,17 @@ def run_cli_sensor_tests(controller, config, key_mappings):
     cli_poll_interval = float(debug_config.get('poll_interval', 0.1))
 
     while True:
-        print("\n--- Sensor Test Menü ---")
-        print(colored("Hinweis: Der dargestellte Status dient nur zu Debugging-Zwecken und entspricht nicht zwingend dem physikalischen Pin-Zustand.", "red"))
         sensor_ids = list(controller.sensors.keys())
-        for idx, sid in enumerate(sensor_ids):
-            print(f"{idx + 1}: Live-Poll {sid}")
-        print("a: Alle Sensoren live-pollen")
-        print("f: Force-Update für alle Sensoren ausführen")
-        print("c: Cover-Zustände aktualisieren")
-        print("q: Zurück zum Hauptmenü")
+        lines = [
+            "\n--- Sensor Test Menü ---",
+            colored("Hinweis: Der dargestellte Status dient nur zu Debugging-Zwecken und entspricht nicht zwingend dem physikalischen Pin-Zustand.", "red"),
+        ]
+        lines.extend(f"{idx + 1}: Live-Poll {sid}" for idx, sid in enumerate(sensor_ids))
+        lines.append("a: Alle Sensoren live-pollen")
+        lines.append("f: Force-Update für alle Sensoren ausführen")
+        lines.append("c: Cover-Zustände aktualisieren")
+        lines.append("q: Zurück zum Hauptmenü")
+        print("\n".join(lines))
 
         try:
             choice = input("Auswahl: ").strip()
@@ -129,59 +170,124 @@ def update_all_covers(controller):
     # Warte kurz für Benutzerrückmeldung
     input("\nCover-Update abgeschlossen. Drücke Enter zum Fortfahren...")
 
+def read_stdin_keys(buf: bytearray) -> list:
+    """Liest verfügbare Eingaben ohne zu blockieren und gibt alle vollständigen Zeilen zurück
+    
+    stdin muss dafür auf non-blocking gestellt sein (siehe set_stdin_nonblocking).
+    """
+    keys = []
+    try:
+        # Direkt vom Dateideskriptor lesen (ohne select und Python-Puffer); unvollständige Zeilen bleiben im Puffer
+        buf.extend(os.read(sys.stdin.fileno(), 64))
+    except BlockingIOError:
+        return keys
+    idx = buf.find(b'\n')
+    while idx != -1:
+        keys.append(bytes(buf[:idx]).decode(errors='ignore').strip())
+        del buf[:idx + 1]
+        idx = buf.find(b'\n')
+    return keys
+
+def set_stdin_nonblocking(enabled: bool) -> bool:
+    """Stellt stdin auf (non-)blocking um und gibt den vorherigen Blocking-Zustand zurück"""
+    fd = sys.stdin.fileno()
+    was_blocking = os.get_blocking(fd)
+    os.set_blocking(fd, not enabled)
+    return was_blocking
+
+class StdinQuitWatcher:
+    """Wartet in einem Hintergrund-Thread blockierend auf 'q' + Enter und setzt dann quit_evt.
+    
+    Die Polling-Schleifen müssen so nicht mehr pro Durchlauf stdin abfragen, sondern warten
+    nur noch mit quit_evt.wait(poll_interval). stop() weckt den Thread über eine Pipe auf,
+    damit er keine spätere Eingabe (z.B. für input()) mehr abfängt.
+    """
+    def __init__(self):
+        self.quit_evt = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="StdinQuitWatcher")
+
+    def __enter__(self):
+        self._thread.start()
+        return self.quit_evt
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def stop(self):
+        """Beendet den Lese-Thread und gibt die Pipe frei"""
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+        self._thread.join()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _run(self):
+        buf = bytearray()
+        fd = sys.stdin.fileno()
+        while not self.quit_evt.is_set():
+            ready = select.select([fd, self._wake_r], [], [])[0]
+            if self._wake_r in ready:
+                return
+            data = os.read(fd, 64)
+            if not data:  # EOF
+                return
+            buf.extend(data)
+            idx = buf.find(b'\n')
+            while idx != -1:
+                if bytes(buf[:idx]).decode(errors='ignore').strip().lower() == 'q':
+                    self.quit_evt.set()
+                    return
+                del buf[:idx + 1]
+                idx = buf.find(b'\n')
+
 def run_live_polling_all_sensors(controller, poll_interval):
     """Führt Live-Polling für alle Sensoren durch, beendbar mit 'q'"""
     print("\nLive-Polling aller Sensoren – Gib 'q' ein und drücke Enter zum Beenden")
     print(colored("Polling-Interval: " + str(poll_interval) + " Sekunden", "cyan"))
     
-    running = True
-    while running:
-        # Zeige Sensor-Status
-        for sensor_id, sensor in controller.sensors.items():
-            if hasattr(sensor, "sync_poll_once"):
-                try:
-                    raw, state = sensor.sync_poll_once()
-                    color = 'green' if state else 'red'
-                    print(f"{sensor_id}: Raw={raw}, State=" + colored(str(state), color))
-                except Exception as e:
-                    print(f"Fehler bei {sensor_id}: {e}")
-        
-        # Prüfe, ob 'q' eingegeben wurde (ohne zu blockieren)
-        # Wir nutzen select um non-blocking I/O zu erreichen
-        if select.select([sys.stdin], [], [], 0)[0]:
-            key = sys.stdin.readline().strip()
-            if key.lower() == 'q':
-                print("\nLive-Polling beendet.")
-                return
-        
-        # Warte entsprechend des Poll-Intervalls
-        time.sleep(poll_interval)
+    with StdinQuitWatcher() as quit_evt:
+        # Warte entsprechend des Poll-Intervalls; endet sofort nach 'q'
+        while True:
+            # Zeige Sensor-Status (alle Pins mit einer einzigen USB-Transaktion)
+            try:
+                results = controller.sync_poll_all()
+            except Exception as e:
+                print(f"Fehler beim Polling: {e}")
+                results = {}
+            for sensor_id, (raw, state) in results.items():
+                color = 'green' if state else 'red'
+                print(f"{sensor_id}: Raw={raw}, State=" + colored(str(state), color))
+            
+            if quit_evt.wait(poll_interval):
+                break
+    print("\nLive-Polling beendet.")
 
 def run_live_polling_single_sensor(sensor_id, sensor, poll_interval):
     """Führt Live-Polling für einen einzelnen Sensor durch, beendbar mit 'q'"""
     print(f"\nLive-Polling für {sensor_id} – Gib 'q' ein und drücke Enter zum Beenden")
     print(colored("Polling-Interval: " + str(poll_interval) + " Sekunden", "cyan"))
     
-    running = True
-    while running:
-        # Zeige Sensor-Status
-        if hasattr(sensor, "sync_poll_once"):
-            try:
-                raw, state = sensor.sync_poll_once()
-                color = 'green' if state else 'red'
-                print(f"{sensor_id}: Raw={raw}, State=" + colored(str(state), color))
-            except Exception as e:
-                print(f"Fehler bei {sensor_id}: {e}")
-        
-        # Prüfe, ob 'q' eingegeben wurde (ohne zu blockieren)
-        if select.select([sys.stdin], [], [], 0)[0]:
-            key = sys.stdin.readline().strip()
-            if key.lower() == 'q':
-                print("\nLive-Polling beendet.")
-                return
-        
-        # Warte entsprechend des Poll-Intervalls
-        time.sleep(poll_interval)
+    # Poll-Methode einmalig ermitteln statt hasattr() in jedem Durchlauf
+    poll = getattr(sensor, "sync_poll_once", None)
+    with StdinQuitWatcher() as quit_evt:
+        # Warte entsprechend des Poll-Intervalls; endet sofort nach 'q'
+        while True:
+            # Zeige Sensor-Status
+            if poll is not None:
+                try:
+                    raw, state = poll()
+                    color = 'green' if state else 'red'
+                    print(f"{sensor_id}: Raw={raw}, State=" + colored(str(state), color))
+                except Exception as e:
+                    print(f"Fehler bei {sensor_id}: {e}")
+            
+            if quit_evt.wait(poll_interval):
+                break
+    print("\nLive-Polling beendet.")
 
 def execute_system_command(command, controller, mqtt_handler=None, config=None):
     from mcp2221_io.logging_config import logger, set_debug_mode
@@ -199,39 +305,35 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
             board_status = mqtt_handler._board_status
             board_message = mqtt_handler._board_status_message
             logger.info(f"Board-Status: {'Online' if board_status else 'Offline'} - {board_message}")
-            mqtt_connected = mqtt_handler.connected.is_set()
+            mqtt_connected = mqtt_handler.is_connected
             logger.info(f"MQTT-Verbindung: {'Verbunden' if mqtt_connected else 'Nicht verbunden'}")
             if hasattr(mqtt_handler, 'test_sensor_pins'):
                 mqtt_handler.test_sensor_pins()
-        logger.info("Actor-Status:")
-        for actor_id, actor in controller.actors.items():
-            if actor:
-                state = actor.state
-                logger.info(f"  - {actor_id}: {state}")
+        # Status gesammelt mit einem einzigen Log-Aufruf ausgeben
+        lines = ["Actor-Status:"]
+        lines.extend(f"  - {actor_id}: {actor.state}" for actor_id, actor in controller.actors.items() if actor)
                 
         # Cover-Status explizit anzeigen
         if controller.covers:
-            logger.info("Cover-Status:")
-            for cover_id, cover in controller.covers.items():
-                logger.info(f"  - {cover_id}: {cover.state} "
-                          f"(Sensoren: open={cover.sensor_open_state}, closed={cover.sensor_closed_state})")
+            lines.append("Cover-Status:")
+            lines.extend(f"  - {cover_id}: {cover.state} "
+                         f"(Sensoren: open={cover.sensor_open_state}, closed={cover.sensor_closed_state})"
+                         for cover_id, cover in controller.covers.items())
+        logger.info("\n".join(lines))
                 
         logger.info("Systemdiagnose abgeschlossen.")
 
         while True:
-            print("\n--- Diagnose-Menü ---")
-            print("c: Konfiguration anzeigen")
-            print("l: Live-Logging anzeigen")
-            print("f: Force-Update für alle Sensoren ausführen")
-            print("r: Alle Zustände neu veröffentlichen")
-            print("q: Zurück zum Hauptmenü")
+            print(_DIAGNOSE_MENU)
             sub = input("Auswahl: ").strip().lower()
             if sub == 'q':
                 print_main_menu(config.get('key_mappings', {}))
                 break
             elif sub == 'c':
                 print("\n[Gesamte Konfiguration]")
-                pprint.pprint(config)
+                # json.dumps (C-Encoder) statt pprint; nicht serialisierbare Werte als str
+                sys.stdout.write(json.dumps(config, indent=2, default=str, ensure_ascii=False))
+                sys.stdout.write("\n")
             elif sub == 'f':
                 # Force-Update für alle Sensoren
                 force_update_all_sensors(controller)
@@ -252,23 +354,13 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                 print("\n[Info] Live-Logging ist aktiviert gemäß 'debugging.level' in config.yaml.")
                 
                 # Aktiviere manuell die Debug-Flags für die Übersicht, ohne die Original-Konfiguration zu ändern
-                # Erstelle eine tiefe Kopie der Konfiguration
-                display_config = copy.deepcopy(config.get("debugging", {}))
-                
-                # Sicherstellen, dass System-Debugging jetzt aktiviert ist (für die Anzeige)
-                if 'system' not in display_config:
-                    display_config['system'] = {}
-                if 'process' not in display_config['system']:
-                    display_config['system']['process'] = True
-                else:
-                    display_config['system']['process'] = True
-                
-                if 'entities' not in display_config['system']:
-                    display_config['system']['entities'] = {}
+                # (flache Kopien nur entlang der geänderten Pfade statt einer tiefen Kopie)
+                debugging_config = config.get("debugging", {})
+                display_config = _override(debugging_config, ('system', 'process'), True)
                 
                 # Explizit Actors und Sensors aktivieren
-                display_config['system']['entities']['actors'] = True
-                display_config['system']['entities']['sensors'] = True
+                display_config = _override(display_config, ('system', 'entities', 'actors'), True)
+                display_config = _override(display_config, ('system', 'entities', 'sensors'), True)
                 
                 print(colored("Hinweis: Folgende Debug-Konfiguration wird für das Live-Logging verwendet:", "cyan"))
                 format_debug_overview(display_config)
@@ -292,16 +384,21 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                 for _, actor in controller.actors.items():
                     if hasattr(actor, 'debug_actors'):
                         actor.debug_actors = True
+                    if hasattr(actor, 'refresh_debug_gates'):
+                        actor.refresh_debug_gates()
+                
+                # Sensor-Debug-Konfiguration einmalig für alle Sensoren aufbauen (wird nur gelesen)
+                temp_debug_config = debugging_config
+                if 'entities' in debugging_config.get('system', {}):
+                    temp_debug_config = _override(debugging_config, ('system', 'entities', 'sensors'), True)
                 
                 for _, sensor in controller.sensors.items():
                     if hasattr(sensor, 'debug_sensors'):
                         sensor.debug_sensors = True
+                    if hasattr(sensor, 'refresh_debug_gates'):
+                        sensor.refresh_debug_gates()
                     if hasattr(sensor, '_init_system_debug_config'):
                         # Sensor-Debug-Konfiguration neu initialisieren
-                        temp_debug_config = copy.deepcopy(config.get('debugging', {}))
-                        if 'system' in temp_debug_config:
-                            if 'entities' in temp_debug_config['system']:
-                                temp_debug_config['system']['entities']['sensors'] = True
                         sensor._init_system_debug_config(temp_debug_config)
                 
                 # Auch Controller-Debug-Konfiguration aktualisieren
@@ -311,12 +408,14 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                     controller.debug_sensors = True
                 if hasattr(controller, 'debug_process'):
                     controller.debug_process = True
+                if hasattr(controller, 'refresh_debug_gates'):
+                    controller.refresh_debug_gates()
                 
                 # MQTT-Callback für die Nachrichtenverfolgung aktivieren, wenn MQTT verbunden ist
                 original_on_message = None
                 original_on_publish = None
                 
-                if mqtt_handler and mqtt_handler.connected.is_set():
+                if mqtt_handler and mqtt_handler.is_connected:
                     print(colored("MQTT verbunden - Ereignisse werden angezeigt", "green"))
                     
                     # Original-Callbacks speichern
@@ -326,28 +425,26 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                     if hasattr(mqtt_handler.mqtt_client, 'on_publish'):
                         original_on_publish = mqtt_handler.mqtt_client.on_publish
                     
+                    # Topics der Aktoren einmalig aufbauen und klassifizieren; weitere Topics beim ersten Empfang
+                    base_topic = mqtt_handler.base_topic
+                    base_prefix = base_topic + '/'
+                    state_topics = {actor_id: f"{base_topic}/{actor_id}/state" for actor_id in controller.actors}
+                    topic_labels = {}
+                    for actor_id, state_topic in state_topics.items():
+                        for topic in (state_topic, f"{base_topic}/{actor_id}/set"):
+                            topic_labels[topic] = classify_topic(topic, base_prefix)
+                    
                     # Debug-Callbacks installieren
                     def debug_on_message(client, userdata, message):
                         topic = message.topic
                         payload = message.payload.decode()
                         
                         # Verbesserte Debug-Ausgabe mit Nachrichtentyp-Identifikation
-                        topic_parts = topic.split('/')
-                        msg_type = ""
-                        if len(topic_parts) >= 3:
-                            if topic_parts[-1] == "set":
-                                msg_type = " [COMMAND]"
-                            elif topic_parts[-1] == "state":
-                                msg_type = " [STATE]"
-                            elif "status" in topic_parts[-1]:
-                                msg_type = " [STATUS]"
-                                
-                        # Target-Gerät identifizieren (wenn vorhanden)
-                        target = ""
-                        if len(topic_parts) >= 2 and topic_parts[0] == mqtt_handler.base_topic:
-                            target = f" [Device={topic_parts[1]}]"
+                        label = topic_labels.get(topic)
+                        if label is None:
+                            label = topic_labels[topic] = classify_topic(topic, base_prefix)
                         
-                        logger.debug(f"[MQTT RECV] Topic={topic}{msg_type}{target} Payload={payload}")
+                        logger.debug(f"[MQTT RECV] Topic={topic}{label} Payload={payload}")
                         
                         # Original-Callback trotzdem ausführen
                         if original_on_message:
@@ -370,10 +467,9 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                     try:
                         mqtt_handler.publish_debug_message("Live-Logging aktiviert")
                         # Teste jeden Aktor mit einer Status-Abfrage
-                        for actor_id in controller.actors:
+                        for actor_id, state_topic in state_topics.items():
                             logger.debug(f"Frage Status von {actor_id} ab")
                             if mqtt_handler:
-                                state_topic = f"{mqtt_handler.base_topic}/{actor_id}/state"
                                 mqtt_handler.mqtt_client.publish(
                                     state_topic,
                                     "",  # Leere Nachricht, um nur das Logging zu testen
@@ -387,15 +483,20 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                 
                 # Aktiviere explizit Sensor-Polling für Debug-Ausgaben
                 logger.info("Starte Sensor-Polling für Debug-Ausgaben...")
+                # Poll-Methoden einmalig ermitteln (auch für das periodische Polling unten)
+                pollers = [
+                    (sensor_id, sensor.sync_poll_once)
+                    for sensor_id, sensor in controller.sensors.items()
+                    if hasattr(sensor, "sync_poll_once")
+                ]
                 # Führe einen Test für alle Sensoren durch, um Debug-Ausgaben zu generieren
-                for sensor_id, sensor in controller.sensors.items():
-                    if hasattr(sensor, "sync_poll_once"):
-                        try:
-                            logger.debug(f"[Sensor] Polling {sensor_id}")
-                            raw, state = sensor.sync_poll_once()
-                            logger.debug(f"[Sensor] {sensor_id}: Raw={raw}, State={state}")
-                        except Exception as e:
-                            logger.error(f"[Sensor] Fehler beim Polling von {sensor_id}: {e}")
+                for sensor_id, poll in pollers:
+                    try:
+                        logger.debug(f"[Sensor] Polling {sensor_id}")
+                        raw, state = poll()
+                        logger.debug(f"[Sensor] {sensor_id}: Raw={raw}, State={state}")
+                    except Exception as e:
+                        logger.error(f"[Sensor] Fehler beim Polling von {sensor_id}: {e}")
                 
                 # Cover-Status explizit ausgeben
                 if controller.covers:
@@ -406,44 +507,51 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                 
                 # Aktivere Polling-Schleife, die auch MQTT-Events und Controller-Status prüft
                 print(colored("Drücke q + Enter zum Beenden, eine andere Taste für eine Log-Nachricht", "cyan"))
+                stdin_was_blocking = set_stdin_nonblocking(True)
                 try:
                     # Aktive Polling-Schleife mit regelmäßigen Status-Updates
-                    count = 0
+                    started = time.monotonic()
+                    next_status = started + 10.0  # Monotone Deadline statt Durchläufe zu zählen (kein Sleep-Drift)
+                    input_buf = bytearray()
                     running = True
                     while running:
                         time.sleep(0.1)
                         
                         # Regelmäßig Log-Status ausgeben, um zu zeigen dass das Logging funktioniert
-                        count += 1
-                        if count % 100 == 0:  # Alle 10 Sekunden
-                            logger.debug(f"Live-Logging aktiv seit {count/10:.1f} Sekunden")
-                            
-                            # Prüfe MQTT-Status, falls verbunden
-                            if mqtt_handler and mqtt_handler.connected.is_set():
-                                logger.debug(f"MQTT verbunden zu {mqtt_handler.config.get('broker')}")
+                        now = time.monotonic()
+                        if now >= next_status:  # Alle 10 Sekunden
+                            next_status += 10.0
+                            # Status-Texte nur aufbauen, wenn DEBUG tatsächlich ausgegeben wird
+                            debug_enabled = logger.debug_enabled
+                            if debug_enabled:
+                                logger.debug(f"Live-Logging aktiv seit {now - started:.1f} Sekunden")
                                 
-                            # Prüfe Controller-Status
-                            actor_states = {aid: actor.state for aid, actor in controller.actors.items()}
-                            logger.debug(f"Aktor-Status: {actor_states}")
-                            
-                            # Cover-Status
-                            if controller.covers:
-                                cover_states = {cid: cover.state for cid, cover in controller.covers.items()}
-                                logger.debug(f"Cover-Status: {cover_states}")
+                                # Prüfe MQTT-Status, falls verbunden
+                                if mqtt_handler and mqtt_handler.is_connected:
+                                    logger.debug(f"MQTT verbunden zu {mqtt_handler.config.get('broker')}")
+                                    
+                                # Prüfe Controller-Status
+                                actor_states = {aid: actor.state for aid, actor in controller.actors_view}
+                                logger.debug(f"Aktor-Status: {actor_states}")
+                                
+                                # Cover-Status
+                                if controller.covers:
+                                    cover_states = {cid: cover.state for cid, cover in controller.covers.items()}
+                                    logger.debug(f"Cover-Status: {cover_states}")
                             
                             # Aktives Polling aller Sensoren alle 10 Sekunden
-                            for sensor_id, sensor in controller.sensors.items():
-                                if hasattr(sensor, "sync_poll_once"):
-                                    try:
+                            for sensor_id, poll in pollers:
+                                try:
+                                    if debug_enabled:
                                         logger.debug(f"[Sensor] Polling {sensor_id}")
-                                        raw, state = sensor.sync_poll_once()
+                                    raw, state = poll()
+                                    if debug_enabled:
                                         logger.debug(f"[Sensor] {sensor_id}: Raw={raw}, State={state}")
-                                    except Exception as e:
-                                        logger.error(f"[Sensor] Fehler beim Polling von {sensor_id}: {e}")
+                                except Exception as e:
+                                    logger.error(f"[Sensor] Fehler beim Polling von {sensor_id}: {e}")
                         
                         # Prüfe, ob eine Taste gedrückt wurde (ohne zu blockieren)
-                        if select.select([sys.stdin], [], [], 0)[0]:
-                            key = sys.stdin.readline().strip()
+                        for key in read_stdin_keys(input_buf):
                             if key.lower() == 'q':
                                 logger.info("Live-Logging wird beendet...")
                                 running = False
@@ -454,9 +562,12 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
                 except Exception as e:
                     logger.error(f"Fehler im Live-Logging: {e}")
                     print(f"\nFehler im Live-Logging: {e}")
+                finally:
+                    # stdin wieder blockierend machen, sonst scheitert das folgende input()
+                    os.set_blocking(sys.stdin.fileno(), stdin_was_blocking)
                 
                 # Ursprüngliche MQTT-Callbacks wiederherstellen
-                if mqtt_handler and mqtt_handler.connected.is_set():
+                if mqtt_handler and mqtt_handler.is_connected:
                     if original_on_message:
                         mqtt_handler.mqtt_client.on_message = original_on_message
                     if original_on_publish:
@@ -475,14 +586,51 @@ def execute_system_command(command, controller, mqtt_handler=None, config=None):
 
     return False
 
-def print_main_menu(key_mappings):
-    print("System gestartet. Steuerung:")
+def describe_key_mappings(key_mappings):
+    """Erzeugt die Beschreibungstexte aller Tastenbelegungen (Taste -> Beschreibung)"""
+    descriptions = {}
     for key, value in key_mappings.items():
         if isinstance(value, dict):
-            print(f"  {key}: {value.get('action', '?').capitalize()} {value.get('target', '?')}")
+            descriptions[key] = f"{value.get('action', '?').capitalize()} {value.get('target', '?')}"
         elif isinstance(value, tuple) and len(value) >= 2:
-            print(f"  {key}: {value[1].capitalize()} {value[0]}")
-    print("\nBitte Taste eingeben und Enter drücken:")
+            descriptions[key] = f"{value[1].capitalize()} {value[0]}"
+    return descriptions
+
+# Zuletzt aufgebautes Hauptmenü: (key_mappings-Objekt, fertiger Text)
+_menu_cache = (None, "")
+
+def print_main_menu(key_mappings):
+    global _menu_cache
+    # Menütext nur neu aufbauen, wenn ein anderes key_mappings-Objekt übergeben wird
+    cached_mappings, menu_text = _menu_cache
+    if cached_mappings is not key_mappings:
+        lines = ["System gestartet. Steuerung:"]
+        lines.extend(f"  {key}: {desc}" for key, desc in describe_key_mappings(key_mappings).items())
+        lines.append("\nBitte Taste eingeben und Enter drücken:\n")
+        menu_text = "\n".join(lines)
+        _menu_cache = (key_mappings, menu_text)
+    sys.stdout.write(menu_text)
+    sys.stdout.flush()
+
+# Zuletzt ermittelte Toggle-Aktoren: (actors-Konfiguration, ((Aktor-ID, entity_type), ...))
+_toggle_cache = (None, ())
+
+def get_toggle_actors(actors_config):
+    """Liefert die toggle-fähigen Aktoren als (Aktor-ID, entity_type) und merkt sich das Ergebnis
+    
+    Neu berechnet wird nur, wenn ein anderes actors-Objekt übergeben wird (z.B. nach Neuladen der Konfiguration).
+    """
+    global _toggle_cache
+    cached_actors, toggle_actors = _toggle_cache
+    if cached_actors is not actors_config:
+        toggle_actors = tuple(
+            (aid, entity_type) for aid, entity_type in (
+                (aid, cfg.get('entity_type', 'switch').lower()) for aid, cfg in actors_config.items()
+            )
+            if entity_type in ('switch', 'lock', 'cover')
+        )
+        _toggle_cache = (actors_config, toggle_actors)
+    return toggle_actors
 
 def custom_event_handler(event, controller, mqtt_handler, config, key_mappings):
     if event.target == 'system' and event.action == 'quit':
@@ -494,19 +642,14 @@ def custom_event_handler(event, controller, mqtt_handler, config, key_mappings):
         execute_system_command(event.action, controller, mqtt_handler, config=config)
 
     elif event.target == 'system' and event.action == 'control':
-        toggle_actors = [
-            aid for aid, cfg in config['actors'].items()
-            if cfg.get('entity_type', 'switch').lower() in ['switch', 'lock', 'cover']
-        ]
+        toggle_actors = get_toggle_actors(config['actors'])
         if not toggle_actors:
             print("Keine Aktoren mit toggle-Funktion vorhanden.")
             return
 
         while True:
             print("\n--- Control Menü: Toggle-Aktoren ---")
-            for idx, aid in enumerate(toggle_actors):
-                entity_type = config['actors'][aid].get('entity_type', 'switch').lower()
-                
+            for idx, (aid, entity_type) in enumerate(toggle_actors):
                 # Aktuellen Zustand anzeigen für Cover
                 if entity_type == 'cover' and aid in controller.covers:
                     cover_state = controller.covers[aid].state
@@ -526,8 +669,7 @@ def custom_event_handler(event, controller, mqtt_handler, config, key_mappings):
                 if choice.isdigit():
                     index = int(choice) - 1
                     if 0 <= index < len(toggle_actors):
-                        selected = toggle_actors[index]
-                        entity_type = config['actors'][selected].get('entity_type', 'switch').lower()
+                        selected, entity_type = toggle_actors[index]
                         
                         # Aktuelle Zustände vor dem Toggle anzeigen
                         if entity_type == 'cover' and selected in controller.covers:
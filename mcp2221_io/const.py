@@ -1,14 +1,29 @@
 # mcp2221_io/const.py
 
 import logging
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 from termcolor import colored
+from mcp2221_io.new_core import get_config
 
-# Hardware-Typ-Konstanten
-MCP2221 = 1
-FT232H = 2
+class HW(IntEnum):
+    """Hardware-Typ-Konstanten"""
+    NONE = -1
+    MCP2221 = 1
+    FT232H = 2
 
-# Standard-Hardware-Wert (wird später gesetzt)
-HW = -1
+# Kurzformen (vergleichbar mit den bisherigen int-Konstanten)
+MCP2221 = HW.MCP2221
+FT232H = HW.FT232H
+
+@dataclass(frozen=True)
+class HardwareSelection:
+    """Unveränderliche Hardware-Auswahl aus der Konfiguration"""
+    hw: HW
+    name: str
+
+_NO_HARDWARE = HardwareSelection(HW.NONE, "NoHardware")
 
 def validate_hardware_config(hw_config):
     """Validiert die Hardware-Konfiguration.
@@ -29,6 +44,41 @@ def validate_hardware_config(hw_config):
     # Genau eine Hardware muss aktiviert sein
     return enabled_hw == 1
 
+@lru_cache(maxsize=4)
+def _select_hardware(frozen_items):
+    """Ermittelt die HardwareSelection für eine eingefrorene Hardware-Konfiguration.
+    
+    Die Konfiguration ändert sich nach dem Start nicht, daher wird das Ergebnis zwischengespeichert.
+    
+    Returns:
+        HardwareSelection: Gewählte Hardware (HW.NONE bei ungültiger Konfiguration)
+    """
+    hw_config = dict(frozen_items)
+    if not validate_hardware_config(hw_config):
+        return _NO_HARDWARE
+    if hw_config.get("mcp2221", False):
+        return HardwareSelection(HW.MCP2221, "MCP2221")
+    return HardwareSelection(HW.FT232H, "FT232H")
+
+def _selection_for(hw_config):
+    """Wertet eine Hardware-Konfiguration über den Cache von _select_hardware aus."""
+    try:
+        return _select_hardware(frozenset(hw_config.items()) if hw_config else frozenset())
+    except TypeError:
+        # Nicht hashbare Werte in der Konfiguration: ohne Cache auswerten
+        return _select_hardware.__wrapped__(hw_config.items())
+
+@lru_cache(maxsize=1)
+def current_hardware():
+    """Liefert die Hardware-Auswahl der globalen Konfiguration.
+    
+    Ersetzt den früheren veränderlichen Modulwert HW; wird einmalig ermittelt.
+    
+    Returns:
+        HardwareSelection: Gewählte Hardware (HW.NONE bei ungültiger Konfiguration)
+    """
+    return _selection_for(get_config().get_value("hardware", {}))
+
 def setup_hardware(hw_config, logger=None):
     """Setzt die zu verwendende Hardware basierend auf der Konfiguration.
     
@@ -37,30 +87,29 @@ def setup_hardware(hw_config, logger=None):
         logger: Optional, ein Logger-Objekt
         
     Returns:
-        str: Beschreibung der gewählten Hardware
+        HardwareSelection: Gewählte Hardware (HW.NONE bei ungültiger Konfiguration)
     """
-    global HW
-    hw_str = "NoHardware"
+    selection = _selection_for(hw_config)
     
-    if not validate_hardware_config(hw_config):
+    if selection.hw is HW.NONE:
         error_msg = "Die Konfiguration des Punkts 'hardware' ist fehlerhaft. " \
                     "Mögliche Fehler: KEIN Eintrag ODER MEHRERE Einträge sind 'true'."
         if logger:
             logger.critical(colored(error_msg, "red"))
         else:
             print(colored(error_msg, "red"))
-        return hw_str
-        
-    if hw_config.get("mcp2221", False):
-        HW = MCP2221
-        hw_str = "MCP2221"
-    elif hw_config.get("ft232h", False):
-        HW = FT232H
-        hw_str = "FT232H"
+        return selection
     
     if logger:
-        logger.info(f"Hardware {hw_str} ausgewählt (HW={HW})")
+        logger.info(f"Hardware {selection.name} ausgewählt (HW={selection.hw.value})")
     else:
-        print(f"Hardware {hw_str} ausgewählt (HW={HW})")
+        print(f"Hardware {selection.name} ausgewählt (HW={selection.hw.value})")
     
-    return hw_str
\ No newline at end of file
+    return selection
+
+def _clear_hardware_cache():
+    """Leert die Hardware-Caches (z.B. für Tests oder nach Neuladen der Konfiguration)"""
+    _select_hardware.cache_clear()
+    current_hardware.cache_clear()
+
+setup_hardware.cache_clear = _clear_hardware_cache
\ No newline at end of file
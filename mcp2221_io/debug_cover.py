@@ -11,7 +11,12 @@ import os
 import time
 import board
 import digitalio
-from datetime import datetime
+
+# NumPy wird nur für die Massenauswertung aufgezeichneter Sensorverläufe benötigt (optional)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def diagnose_cover_sensors():
     """
@@ -41,37 +46,66 @@ def diagnose_cover_sensors():
         print("- INV12: Mit beiden Sensoren invertiert")
         print("\nStarte Diagnose...")
         
+        # Beide Sensoren mit einer USB-Transaktion lesen, falls der MCP2221-Patch verfügbar ist
+        try:
+            from mcp2221_io.mcp2221_patch import read_gpio_pair
+            read_gpio_pair()
+        except Exception:
+            read_gpio_pair = None
+        
+        # Zeitstempel nur neu formatieren, wenn sich die Sekunde geändert hat
+        last_sec = -1
+        timestamp = ""
+        next_tick = time.monotonic()
+        samples = 0
         while True:
             # Direktes Auslesen der Pins
-            raw_open = open_pin.value
-            raw_closed = closed_pin.value
+            if read_gpio_pair is not None:
+                raw_open, raw_closed = read_gpio_pair()
+            else:
+                raw_open = open_pin.value
+                raw_closed = closed_pin.value
             
             # Timestamp
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            sec = int(time.time())
+            if sec != last_sec:
+                last_sec = sec
+                timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
             
-            # Standard-Logik (keine Invertierung)
-            state_std = get_cover_state(raw_open, raw_closed, False, False)
+            # Invertierte Werte einmalig berechnen
+            inv_open, inv_closed = not raw_open, not raw_closed
             
-            # Verschiedene Invertierungskombinationen
-            state_inv1 = get_cover_state(raw_open, raw_closed, True, False)  # open invertiert
-            state_inv2 = get_cover_state(raw_open, raw_closed, False, True)  # closed invertiert
-            state_inv12 = get_cover_state(raw_open, raw_closed, True, True)  # beide invertiert
+            # Alle vier Invertierungskombinationen liegen in der Tabelle direkt hintereinander:
+            # STD (keine), INV2 (closed invertiert), INV1 (open invertiert), INV12 (beide invertiert)
+            base = (bool(raw_open) << 3) | (bool(raw_closed) << 2)
+            state_std, state_inv2, state_inv1, state_inv12 = _STATE_TABLE[base:base + 4]
             
-            # Ausgabe
-            print(f"[{timestamp}] RAW: open={raw_open}, closed={raw_closed}")
-            print(f"  Zustandsberechnung:")
-            print(f"  - STD   (open={raw_open}, closed={raw_closed}): {state_std}")
-            print(f"  - INV1  (open={not raw_open}, closed={raw_closed}): {state_inv1}")
-            print(f"  - INV2  (open={raw_open}, closed={not raw_closed}): {state_inv2}")
-            print(f"  - INV12 (open={not raw_open}, closed={not raw_closed}): {state_inv12}")
-            print("=" * 60)
+            # Ausgabe als ein Block schreiben, Flush nur alle 5 Messungen
+            sys.stdout.write(
+                f"[{timestamp}] RAW: open={raw_open}, closed={raw_closed}\n"
+                f"  Zustandsberechnung:\n"
+                f"  - STD   (open={raw_open}, closed={raw_closed}): {state_std}\n"
+                f"  - INV1  (open={inv_open}, closed={raw_closed}): {state_inv1}\n"
+                f"  - INV2  (open={raw_open}, closed={inv_closed}): {state_inv2}\n"
+                f"  - INV12 (open={inv_open}, closed={inv_closed}): {state_inv12}\n"
+                f"{'=' * 60}\n"
+            )
+            samples += 1
+            if samples % 5 == 0:
+                sys.stdout.flush()
             
-            # Warte 1 Sekunde
-            time.sleep(1)
+            # Warte bis zum nächsten 1-Sekunden-Takt (Laufzeit der Iteration wird abgezogen)
+            next_tick += 1.0
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Überlauf: Takt neu ansetzen statt aufzuholen
             
     except KeyboardInterrupt:
         print("\nDiagnose beendet.")
     finally:
+        sys.stdout.flush()
         # Pins aufräumen
         try:
             open_pin.deinit()
@@ -79,9 +113,10 @@ def diagnose_cover_sensors():
         except:
             pass
 
-def get_cover_state(sensor_open, sensor_closed, invert_open, invert_closed):
+def _compute_cover_state(sensor_open, sensor_closed, invert_open, invert_closed):
     """
     Berechnet den Cover-Zustand basierend auf den Sensorwerten und Invertierungsoptionen.
+    Wird nur einmalig zum Aufbau von _STATE_TABLE verwendet.
     
     :param sensor_open: Zustand des "offen"-Sensors
     :param sensor_closed: Zustand des "geschlossen"-Sensors
@@ -105,5 +140,47 @@ def get_cover_state(sensor_open, sensor_closed, invert_open, invert_closed):
     else:
         return "UNGÜLTIG"
 
+# Alle 16 Kombinationen einmalig vorberechnen; Index = open<<3 | closed<<2 | invert_open<<1 | invert_closed
+_STATE_TABLE = tuple(
+    _compute_cover_state(bool(key & 8), bool(key & 4), bool(key & 2), bool(key & 1))
+    for key in range(16)
+)
+
+def get_cover_state(sensor_open, sensor_closed, invert_open, invert_closed):
+    """
+    Liefert den Cover-Zustand für die Sensorwerte und Invertierungsoptionen aus der Tabelle.
+    
+    :param sensor_open: Zustand des "offen"-Sensors
+    :param sensor_closed: Zustand des "geschlossen"-Sensors
+    :param invert_open: Ob der "offen"-Sensor invertiert werden soll
+    :param invert_closed: Ob der "geschlossen"-Sensor invertiert werden soll
+    :return: Der berechnete Zustand des Covers
+    """
+    return _STATE_TABLE[(bool(sensor_open) << 3) | (bool(sensor_closed) << 2)
+                        | (bool(invert_open) << 1) | bool(invert_closed)]
+
+# Zustände nach Code 2*open + closed (nach Invertierung)
+_LABELS = ("IN_BEWEGUNG", "CLOSED", "OPEN", "UNGÜLTIG")
+if np is not None:
+    _LABELS = np.array(_LABELS)
+
+def get_cover_states_bulk(open_arr, closed_arr, invert_open, invert_closed):
+    """
+    Klassifiziert aufgezeichnete Sensorverläufe in einem Durchgang (z.B. für Offline-Log-Analyse).
+    Für die Live-Schleife bleibt get_cover_state zuständig.
+    
+    :param open_arr: Werte des "offen"-Sensors (Array oder Sequenz von bool)
+    :param closed_arr: Werte des "geschlossen"-Sensors (Array oder Sequenz von bool)
+    :param invert_open: Ob der "offen"-Sensor invertiert werden soll
+    :param invert_closed: Ob der "geschlossen"-Sensor invertiert werden soll
+    :return: NumPy-Array mit den berechneten Zuständen je Messwert
+    """
+    if np is None:
+        raise ImportError("get_cover_states_bulk benötigt NumPy (pip install numpy)")
+    o = np.asarray(open_arr, dtype=bool) ^ bool(invert_open)
+    c = np.asarray(closed_arr, dtype=bool) ^ bool(invert_closed)
+    code = (o.astype(np.int8) << 1) | c.astype(np.int8)
+    return np.take(_LABELS, code)
+
 if __name__ == "__main__":
     diagnose_cover_sensors()
\ No newline at end of file
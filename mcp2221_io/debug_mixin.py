@@ -2,141 +2,204 @@
 # Version: 1.0.0
 
 from typing import Dict, Optional, Any, List, Tuple
+from types import MethodType
 import os
 from .logging_config import logger, LogCategory
 
+# Logger-Methoden und Kategorien einmalig binden (spart Attribut-Lookups pro Debug-Aufruf)
+_debug = logger.debug
+_error = logger.error
+_CAT_SYSTEM = LogCategory.SYSTEM
+_CAT_ACTOR = LogCategory.ACTOR
+_CAT_SENSOR = LogCategory.SENSOR
+_CAT_COVER = LogCategory.COVER
+_CAT_GPIO = LogCategory.GPIO
+_CAT_MQTT = LogCategory.MQTT
+
+# Ersatz für deaktivierte Debug-Methoden: kehrt sofort zurück, ohne Flag-Prüfung
+_NOOP = lambda *args, **kwargs: None
+
+# Debug-Methoden und das Flag, das sie freischaltet
+_GATED_METHODS = (
+    ('debug_system_process', 'debug_process'),
+    ('debug_startup', 'debug_process'),
+    ('debug_shutdown', 'debug_process'),
+    ('debug_config_load', 'debug_process'),
+    ('debug_system_error', 'debug_process'),
+    ('debug_actor_state', 'debug_actors'),
+    ('debug_actor_error', 'debug_actors'),
+    ('debug_sensor_state', 'debug_sensors'),
+    ('debug_sensor_error', 'debug_sensors'),
+    ('debug_cover_state', 'debug_actors'),
+    ('debug_cover_error', 'debug_actors'),
+    ('debug_gpio', '_debug_gpio_enabled'),
+    ('debug_mqtt_process', '_debug_mqtt_process_enabled'),
+    ('debug_mqtt_send', '_debug_mqtt_send_enabled'),
+    ('debug_mqtt_receive', '_debug_mqtt_receive_enabled'),
+)
+
 class DebugMixin:
     """Universelle Mixin-Klasse für Debug-Funktionalität in allen Komponenten"""
     
+    # Kein eigenes __dict__, damit Klassen mit __slots__ das Mixin nutzen können
+    __slots__ = ()
+    
+    # Von _init_debug_config gesetzte Attribute (für __slots__ der erbenden Klassen)
+    _debug_slots = (
+        'debug_config', 'system_debug_config', 'debug_process',
+        'debug_entities', 'debug_actors', 'debug_sensors',
+        'mqtt_debug_config', '_debug_mqtt_process_enabled', '_debug_mqtt_send_enabled',
+        '_debug_mqtt_receive_enabled', '_debug_gpio_enabled', 'debug_mode',
+    ) + tuple(method_name for method_name, _ in _GATED_METHODS)
+    
     def _init_debug_config(self, config: Dict[str, Any]):
-        """Initialisiert die Debug-Konfiguration aus dem config-Dict"""
+        """Initialisiert die Debug-Konfiguration aus dem config-Dict
+        
+        Setzt alle Debug-Flags immer als bool, daher prüfen die debug_*-Methoden sie ohne hasattr().
+        """
         self.debug_config = config.get('debugging', {})
         
         # System-Debug-Konfiguration
         self.system_debug_config = self.debug_config.get('system', {})
-        self.debug_process = self.system_debug_config.get('process', False)
+        self.debug_process = bool(self.system_debug_config.get('process', False))
         
         # Entities Debug (Actors, Sensors)
         self.debug_entities = self.system_debug_config.get('entities', {})
-        self.debug_actors = self.debug_entities.get('actors', False)
-        self.debug_sensors = self.debug_entities.get('sensors', False)
+        self.debug_actors = bool(self.debug_entities.get('actors', False))
+        self.debug_sensors = bool(self.debug_entities.get('sensors', False))
         
         # MQTT-Debug-Konfiguration
         self.mqtt_debug_config = self.debug_config.get('mqtt', {})
-        self.debug_mqtt_process = self.mqtt_debug_config.get('process', False)
-        self.debug_mqtt_send = self.mqtt_debug_config.get('send', False)
-        self.debug_mqtt_receive = self.mqtt_debug_config.get('receive', False)
+        # Flags heißen anders als die gleichnamigen Methoden, sonst würde das Flag die Methode verdecken
+        self._debug_mqtt_process_enabled = bool(self.mqtt_debug_config.get('process', False))
+        self._debug_mqtt_send_enabled = bool(self.mqtt_debug_config.get('send', False))
+        self._debug_mqtt_receive_enabled = bool(self.mqtt_debug_config.get('receive', False))
         
         # GPIO-Debug
-        self.debug_gpio = self.debug_config.get('gpio', False)
+        self._debug_gpio_enabled = bool(self.debug_config.get('gpio', False))
         
         # Debug-Modus aus Umgebungsvariable
         self.debug_mode = os.environ.get('MCP2221_DEBUG', '0') == '1'
+        
+        self.refresh_debug_gates()
+    
+    def refresh_debug_gates(self):
+        """Bindet die debug_*-Methoden passend zu den aktuellen Flags.
+        
+        Deaktivierte Methoden werden durch _NOOP ersetzt. Wird ein Flag zur Laufzeit
+        geändert (z.B. debug_actors = True), muss diese Methode erneut aufgerufen werden.
+        """
+        for method_name, flag in _GATED_METHODS:
+            if getattr(self, flag):
+                setattr(self, method_name, MethodType(DebugMixin.__dict__[method_name], self))
+            else:
+                setattr(self, method_name, _NOOP)
     
     # =========== SYSTEM DEBUG ===========
     
     def debug_system_process(self, message: str, error: bool = False):
         """Debug-Ausgabe für System-Prozess-Informationen"""
-        if hasattr(self, 'debug_process') and self.debug_process:
+        if self.debug_process:
             if error:
-                logger.error(message, LogCategory.SYSTEM)
+                _error(message, _CAT_SYSTEM)
             else:
-                logger.debug(message, LogCategory.SYSTEM)
+                _debug(message, _CAT_SYSTEM)
     
     def debug_startup(self, message: str):
         """Debug-Ausgabe für System-Startup-Informationen"""
-        if hasattr(self, 'debug_process') and self.debug_process:
-            logger.debug(f"Startup: {message}", LogCategory.SYSTEM)
+        if self.debug_process:
+            _debug(f"Startup: {message}", _CAT_SYSTEM)
     
     def debug_shutdown(self, message: str):
         """Debug-Ausgabe für System-Shutdown-Informationen"""
-        if hasattr(self, 'debug_process') and self.debug_process:
-            logger.debug(f"Shutdown: {message}", LogCategory.SYSTEM)
+        if self.debug_process:
+            _debug(f"Shutdown: {message}", _CAT_SYSTEM)
     
     def debug_config_load(self, component: str, config: Dict):
         """Debug-Ausgabe für Konfigurationsladungen"""
-        if hasattr(self, 'debug_process') and self.debug_process:
-            logger.debug(f"Config Load: {component}", LogCategory.SYSTEM)
+        if self.debug_process:
+            _debug(f"Config Load: {component}", _CAT_SYSTEM)
     
     def debug_system_error(self, message: str, error: Optional[Exception] = None):
         """Debug-Ausgabe für System-Fehler"""
-        if hasattr(self, 'debug_process') and self.debug_process:
-            logger.error(message, LogCategory.SYSTEM, exception=error)
+        if self.debug_process:
+            _error(message, _CAT_SYSTEM, exception=error)
     
     # =========== ACTOR DEBUG ===========
     
     def debug_actor_state(self, actor_id: str, state: Any, additional_info: Optional[str] = None):
         """Debug-Ausgabe für Actor-Zustandsänderungen"""
-        if hasattr(self, 'debug_actors') and self.debug_actors:
+        if self.debug_actors:
             info = f" ({additional_info})" if additional_info else ""
-            logger.debug(f"{state}{info}", LogCategory.ACTOR, actor_id)
+            _debug(f"{state}{info}", _CAT_ACTOR, actor_id)
     
     def debug_actor_error(self, actor_id: str, message: str, error: Optional[Exception] = None):
         """Debug-Ausgabe für Actor-spezifische Fehler"""
-        if hasattr(self, 'debug_actors') and self.debug_actors:
-            logger.error(message, LogCategory.ACTOR, actor_id, error)
+        if self.debug_actors:
+            _error(message, _CAT_ACTOR, actor_id, error)
     
     # =========== SENSOR DEBUG ===========
     
     def debug_sensor_state(self, sensor_id: str, state: Any, additional_info: Optional[str] = None):
         """Debug-Ausgabe für Sensor-Zustandsänderungen"""
-        if hasattr(self, 'debug_sensors') and self.debug_sensors:
+        if self.debug_sensors:
             info = f" ({additional_info})" if additional_info else ""
-            logger.debug(f"{state}{info}", LogCategory.SENSOR, sensor_id)
+            _debug(f"{state}{info}", _CAT_SENSOR, sensor_id)
     
     def debug_sensor_error(self, sensor_id: str, message: str, error: Optional[Exception] = None):
         """Debug-Ausgabe für Sensor-spezifische Fehler"""
-        if hasattr(self, 'debug_sensors') and self.debug_sensors:
-            logger.error(message, LogCategory.SENSOR, sensor_id, error)
+        if self.debug_sensors:
+            _error(message, _CAT_SENSOR, sensor_id, error)
     
     # =========== COVER DEBUG ===========
     
     def debug_cover_state(self, cover_id: str, state: Any, additional_info: Optional[str] = None):
         """Debug-Ausgabe für Cover-Zustandsänderungen"""
-        if hasattr(self, 'debug_actors') and self.debug_actors:
+        if self.debug_actors:
             info = f" ({additional_info})" if additional_info else ""
-            logger.debug(f"{state}{info}", LogCategory.COVER, cover_id)
+            _debug(f"{state}{info}", _CAT_COVER, cover_id)
     
     def debug_cover_error(self, cover_id: str, message: str, error: Optional[Exception] = None):
         """Debug-Ausgabe für Cover-spezifische Fehler"""
-        if hasattr(self, 'debug_actors') and self.debug_actors:
-            logger.error(message, LogCategory.COVER, cover_id, error)
+        if self.debug_actors:
+            _error(message, _CAT_COVER, cover_id, error)
     
     # =========== GPIO DEBUG ===========
     
     def debug_gpio(self, message: str, pin: Optional[str] = None):
         """Debug-Ausgabe für GPIO-Operationen"""
-        if hasattr(self, 'debug_gpio') and self.debug_gpio:
+        if self._debug_gpio_enabled:
             if pin:
-                logger.debug(message, LogCategory.GPIO, pin)
+                _debug(message, _CAT_GPIO, pin)
             else:
-                logger.debug(message, LogCategory.GPIO)
+                _debug(message, _CAT_GPIO)
     
     # =========== MQTT DEBUG ===========
     
     def debug_mqtt_process(self, message: str):
         """Debug-Ausgabe für MQTT-Prozess-Informationen"""
-        if hasattr(self, 'debug_mqtt_process') and self.debug_mqtt_process:
-            logger.debug(message, LogCategory.MQTT)
+        if self._debug_mqtt_process_enabled:
+            _debug(message, _CAT_MQTT)
     
     def debug_mqtt_send(self, topic: str, payload: str, retained: bool = False, qos: int = 0):
         """Debug-Ausgabe für gesendete MQTT-Nachrichten"""
-        if hasattr(self, 'debug_mqtt_send') and self.debug_mqtt_send:
-            # Details-String zusammenbauen
-            details = []
-            if retained:
-                details.append("RETAINED")
-            if qos > 0:
-                details.append(f"QoS={qos}")
-            
-            details_str = f" [{' '.join(details)}]" if details else ""
-            logger.debug(f"SEND Topic={topic} Payload={payload}{details_str}", LogCategory.MQTT)
+        if not self._debug_mqtt_send_enabled:
+            return
+        # Details-String zusammenbauen
+        details = []
+        if retained:
+            details.append("RETAINED")
+        if qos > 0:
+            details.append(f"QoS={qos}")
+        
+        details_str = f" [{' '.join(details)}]" if details else ""
+        _debug(f"SEND Topic={topic} Payload={payload}{details_str}", _CAT_MQTT)
     
     def debug_mqtt_receive(self, topic: str, payload: str):
         """Debug-Ausgabe für empfangene MQTT-Nachrichten"""
-        if hasattr(self, 'debug_mqtt_receive') and self.debug_mqtt_receive:
-            logger.debug(f"RECV Topic={topic} Payload={payload}", LogCategory.MQTT)
+        if self._debug_mqtt_receive_enabled:
+            _debug(f"RECV Topic={topic} Payload={payload}", _CAT_MQTT)
     
     def debug_mqtt_error(self, message: str, exception: Optional[Exception] = None):
         """Debug-Ausgabe für MQTT-Fehler"""
-        logger.error(message, LogCategory.MQTT, exception=exception)
\ No newline at end of file
+        _error(message, _CAT_MQTT, exception=exception)
\ No newline at end of file
@@ -15,6 +15,9 @@ from pyftdi.gpio import GpioController
 LED_PIN = 0  # Der GPIO-Pin, an dem die LED angeschlossen ist (D0/ADBUS0)
 BLINK_DELAY = 0.5  # Verzögerung in Sekunden zwischen ein/aus
 
+# Bitmaske einmalig beim Laden berechnen statt in jedem Schleifendurchlauf
+LED_MASK = 1 << LED_PIN
+
 def main():
     # Initialisierung des GPIO-Controllers
     gpio = GpioController()
@@ -24,19 +27,19 @@ def main():
         gpio.open_from_url('ftdi://ftdi:232h/1')
         
         # Setze den LED-Pin als Ausgang
-        gpio.set_direction(1 << LED_PIN, 1 << LED_PIN)
+        gpio.set_direction(LED_MASK, LED_MASK)
         
         print("LED-Blink-Programm gestartet. Drücken Sie Strg+C zum Beenden.")
         
         # Hauptschleife zum Blinken der LED
         while True:
             # LED einschalten
-            gpio.set_output(1 << LED_PIN, 1 << LED_PIN)
+            gpio.set_output(LED_MASK, LED_MASK)
             print("LED AN")
             time.sleep(BLINK_DELAY)
             
             # LED ausschalten
-            gpio.set_output(1 << LED_PIN, 0)
+            gpio.set_output(LED_MASK, 0)
             print("LED AUS")
             time.sleep(BLINK_DELAY)
             
@@ -5,6 +5,7 @@ import time
 import sys
 import os
 import logging
+import hashlib
 
 # Füge das Projektverzeichnis zum Suchpfad hinzu
 project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -16,6 +17,16 @@ from mcp2221_io import Sensor, Actor, Cover, CoverState, LogCategory, logger
 # Konfiguriere Logging
 logger.set_level(logging.DEBUG)
 
+# Testfälle als (open, closed, erwarteter Zustand); None = ungültig, Zustand darf sich nicht ändern
+TEST_CASES = (
+    (False, True, CoverState.CLOSED),    # Tor geschlossen
+    (False, False, CoverState.OPENING),  # Tor öffnet sich
+    (True, False, CoverState.OPEN),      # Tor offen
+    (False, False, CoverState.CLOSING),  # Tor schließt sich
+    (False, True, CoverState.CLOSED),    # Tor wieder geschlossen
+    (True, True, None),                  # Ungültiger Zustand (beide Sensoren aktiv)
+)
+
 def test_garage_door_logic():
     """Testet die Logik der Garagentor-Steuerung mit simulierten Sensoren"""
     print("=== Garage Door Logic Test ===")
@@ -44,33 +55,18 @@ def test_garage_door_logic():
     cover.set_state_changed_callback(on_cover_state_changed)
     
     # Teste verschiedene Sensorzustände
-    test_cases = [
-        # Tor geschlossen
-        {"open": False, "closed": True, "expected": CoverState.CLOSED},
-        # Tor öffnet sich
-        {"open": False, "closed": False, "expected": CoverState.OPENING},
-        # Tor offen
-        {"open": True, "closed": False, "expected": CoverState.OPEN},
-        # Tor schließt sich
-        {"open": False, "closed": False, "expected": CoverState.CLOSING},
-        # Tor wieder geschlossen
-        {"open": False, "closed": True, "expected": CoverState.CLOSED},
-        # Ungültiger Zustand (beide Sensoren aktiv)
-        {"open": True, "closed": True, "expected": None},
-    ]
-    
-    for i, test_case in enumerate(test_cases):
+    for i, (op, cl, expected) in enumerate(TEST_CASES):
         print(f"\n=== Test Case {i+1} ===")
-        print(f"Setze Sensorzustände: open={test_case['open']}, closed={test_case['closed']}")
-        print(f"Erwarteter Zustand: {test_case['expected']}")
+        print(f"Setze Sensorzustände: open={op}, closed={cl}")
+        print(f"Erwarteter Zustand: {expected}")
         
         old_state = cover.state
-        cover.update_sensor_states(test_case['open'], test_case['closed'])
+        cover.update_sensor_states(op, cl)
         
         print(f"Aktueller Zustand: {cover.state}")
-        if test_case['expected'] and cover.state != test_case['expected']:
-            print(f"❌ FEHLER: Erwarteter Zustand {test_case['expected']} ist nicht gleich dem aktuellen Zustand {cover.state}")
-        elif not test_case['expected']: # Bei ungültigen Zuständen sollte sich nichts ändern
+        if expected and cover.state != expected:
+            print(f"❌ FEHLER: Erwarteter Zustand {expected} ist nicht gleich dem aktuellen Zustand {cover.state}")
+        elif not expected: # Bei ungültigen Zuständen sollte sich nichts ändern
             if old_state == cover.state:
                 print(f"✅ OK: Zustand wurde bei ungültigem Sensorstatus nicht geändert: {cover.state}")
             else:
@@ -91,7 +87,6 @@ import time
 import sys
 import os
 import logging
-from datetime import datetime
 
 # Füge das Projektverzeichnis zum Suchpfad hinzu
 project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -113,12 +108,20 @@ def main():
     closed_pin = digitalio.DigitalInOut(board.G3)
     closed_pin.direction = digitalio.Direction.INPUT
     
+    # Zeitstempel nur neu formatieren, wenn sich die Sekunde geändert hat
+    last_sec = -1
+    timestamp = ""
+    next_tick = time.monotonic()
+    samples = 0
     try:
         while True:
             open_value = open_pin.value
             closed_value = closed_pin.value
             
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            sec = int(time.time())
+            if sec != last_sec:
+                last_sec = sec
+                timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
             
             # Status ausgeben
             status_line = f"[{timestamp}] SENSOR STATUS: open={open_value}, closed={closed_value} | "
@@ -133,12 +136,24 @@ def main():
             elif open_value and closed_value:
                 status_line += "ZUSTAND: UNGÜLTIG (beide Sensoren aktiv)"
             
-            print(status_line)
-            time.sleep(1)
+            # Ausgabe gepuffert schreiben, Flush nur alle 5 Messungen
+            sys.stdout.write(status_line + "\\n")
+            samples += 1
+            if samples % 5 == 0:
+                sys.stdout.flush()
+            
+            # Fester 1-Sekunden-Takt: Laufzeit der Iteration wird von der Wartezeit abgezogen
+            next_tick += 1.0
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Überlauf: Takt neu ansetzen statt aufzuholen
             
     except KeyboardInterrupt:
         print("\\nDiagnostik beendet.")
     finally:
+        sys.stdout.flush()
         # Pins aufräumen
         open_pin.deinit()
         closed_pin.deinit()
@@ -147,8 +162,23 @@ if __name__ == "__main__":
     main()
 """
     
-    # Schreibe die Datei
+    # Hash-Marker direkt nach der Shebang-Zeile einfügen
+    shebang, _, rest = script_content.partition("\n")
+    hash_marker = f"# hash: {hashlib.md5(script_content.encode()).hexdigest()}\n"
+    script_content = f"{shebang}\n{hash_marker}{rest}"
+    
     script_path = os.path.join(project_dir, "mcp2221_io", "sensor_diagnostics.py")
+    
+    # Nur schreiben, wenn die vorhandene Datei nicht aus derselben Vorlage stammt
+    if os.path.exists(script_path):
+        with open(script_path, "r") as f:
+            f.readline()
+            if f.readline() == hash_marker:
+                print(f"Diagnostik-Skript ist aktuell: {script_path}")
+                print("Führe es aus mit: python3 -m mcp2221_io.sensor_diagnostics")
+                return
+    
+    # Schreibe die Datei
     with open(script_path, "w") as f:
         f.write(script_content)
     
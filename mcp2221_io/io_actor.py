@@ -3,17 +3,88 @@
 
 import board
 import digitalio
+import functools
+import heapq
+import itertools
 import time
 import threading
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 
 from .logging_config import logger, LogCategory
 from .io_device import IODevice
 from .debug_mixin import DebugMixin
 
+class _ResetScheduler:
+    """Gemeinsamer Scheduler für die Auto-Resets aller Actors (ein Thread statt einem pro Reset)"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> '_ResetScheduler':
+        """Singleton-Instanz zurückgeben"""
+        if cls._instance is None:
+            cls._instance = _ResetScheduler()
+        return cls._instance
+
+    def __init__(self):
+        # Min-Heap aus [Deadline (monotonic), Sequenz, Aktion]; Aktion None = abgebrochen
+        self._heap: List[list] = []
+        self._sequence = itertools.count()
+        self._cv = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="ActorResetScheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cv:
+                while True:
+                    # Abgebrochene Einträge (Tombstones) verwerfen
+                    while self._heap and self._heap[0][2] is None:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cv.wait()
+                        continue
+                    # Gegen die absolute Deadline warten, damit verspätetes Aufwachen nicht aufsummiert
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._cv.wait(timeout)
+                action = heapq.heappop(self._heap)[2]
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"Fehler im Reset-Scheduler: {e}", LogCategory.ACTOR)
+
+    def enter(self, delay: float, action: Callable[[], None]) -> list:
+        """
+        Plant eine Aktion nach Ablauf der Verzögerung ein
+
+        :param delay: Verzögerung in Sekunden
+        :param action: Auszuführende Aktion
+        :return: Handle zum Abbrechen
+        """
+        entry = [time.monotonic() + delay, next(self._sequence), action]
+        with self._cv:
+            heapq.heappush(self._heap, entry)
+            # Nur wecken, wenn sich der nächste Termin nach vorne verschiebt
+            if self._heap[0] is entry:
+                self._cv.notify()
+        return entry
+
+    def cancel(self, entry: Optional[list]):
+        """Bricht eine geplante Aktion ab, falls sie noch aussteht"""
+        if entry is None:
+            return
+        with self._cv:
+            entry[2] = None
+
 class Actor(IODevice, DebugMixin):
     """Repräsentiert einen Actor (Aktor) mit GPIO-Steuerung"""
 
+    __slots__ = (
+        '_gpio_pin', '_digital_pin', '_last_physical', '_reset_delay', '_reset_handle', 'on_reset',
+        'entity_type', '_reset_generation', '_set_lock',
+    ) + DebugMixin._debug_slots
+
     def __init__(
         self, 
         pin: str, 
@@ -36,14 +107,26 @@ class Actor(IODevice, DebugMixin):
         self._gpio_pin = getattr(board, self._pin)
         self._digital_pin = digitalio.DigitalInOut(self._gpio_pin)
         self._digital_pin.direction = digitalio.Direction.OUTPUT
+        self._last_physical: Optional[bool] = None  # Zuletzt geschriebener Pegel (None = noch nie geschrieben)
 
         # Reset-Konfiguration
         self._reset_delay = reset_delay
-        self._reset_thread: Optional[threading.Thread] = None
+        self._reset_handle: Optional[list] = None
         self.on_reset: Optional[Callable[[], None]] = None
+        # Generation: jeder set()-Aufruf erhöht sie; ein Reset wird nur für seine eigene Generation ausgeführt.
+        # Reentrant, da der Reset selbst set() bzw. on_reset (-> set()) aufruft.
+        self._reset_generation = 0
+        self._set_lock = threading.RLock()
 
-        # Initialer Zustand
-        self.set(False)
+        # Entity-Typ (wird vom IOController aus der MQTT-Konfiguration gesetzt)
+        self.entity_type: str = 'switch'
+
+        # Initialer Zustand: direkt schreiben, ohne Reset-Timer-Logik von set().
+        # Der Schreibzugriff bleibt nötig, da der Ausgangs-Latch des MCP2221 beim
+        # Umschalten der Richtung seinen vorherigen Pegel behält.
+        self._state = False
+        self._last_physical = self._convert(False)
+        self._digital_pin.value = self._last_physical
 
     def set(self, state: bool):
         """
@@ -51,12 +134,22 @@ class Actor(IODevice, DebugMixin):
 
         :param state: Neuer Zustand (True/False)
         """
+        with self._set_lock:
+            # Jeder neue Zustand macht bereits fällige, aber noch nicht ausgeführte Resets ungültig
+            self._reset_generation += 1
+            self._set(state)
+
+    def _set(self, state: bool):
+        """Setzt den Zustand (Aufrufer hält _set_lock)"""
         try:
-            digital_state = self._apply_inversion(state)
-            self._digital_pin.value = digital_state
+            digital_state = self._convert(state)
+            # Nur schreiben, wenn sich der Pegel ändert (jeder Schreibzugriff ist ein USB-Roundtrip)
+            if digital_state != self._last_physical:
+                self._digital_pin.value = digital_state
+                self._last_physical = digital_state
             self._state = state
 
-            if self.debug_actors:
+            if self.debug_actors and logger.debug_enabled:
                 logger.debug(f"Pin {self._pin} → gesetzt auf {'ON' if state else 'OFF'} (digital: {digital_state})", 
                            LogCategory.ACTOR)
 
@@ -67,27 +160,34 @@ class Actor(IODevice, DebugMixin):
                 logger.error(f"Fehler beim Setzen von Pin {self._pin}: {e}", LogCategory.ACTOR)
 
     def _start_reset_timer(self):
-        """Startet den Reset-Timer für den Actor"""
-        if self._reset_thread and self._reset_thread.is_alive():
-            return
-
-        def reset_callback():
+        """Startet (bzw. erneuert) den Reset-Timer für den Actor"""
+        scheduler = _ResetScheduler.get_instance()
+        scheduler.cancel(self._reset_handle)
+        self._reset_handle = scheduler.enter(
+            self._reset_delay, functools.partial(self._reset_action, self._reset_generation))
+
+        if self.debug_actors and logger.debug_enabled:
+            logger.debug(f"Pin {self._pin} → Reset-Timer gestartet: {self._reset_delay}s", LogCategory.ACTOR)
+
+    def _reset_action(self, generation: int):
+        """Führt den automatischen Reset aus (im Scheduler-Thread)
+        
+        :param generation: Generation beim Einplanen; veraltete Resets werden verworfen
+        """
+        with self._set_lock:
+            # Der Scheduler kann den Eintrag bereits entnommen haben, bevor cancel() greift:
+            # wurde seitdem neu gesetzt, darf dieser Reset den neuen Zustand nicht überschreiben
+            if generation != self._reset_generation:
+                return
+            self._reset_handle = None
             try:
-                if self.debug_actors:
-                    logger.debug(f"Pin {self._pin} → Auto-Reset startet in {self._reset_delay} Sekunden", LogCategory.ACTOR)
-                time.sleep(self._reset_delay)
-                if self.on_reset:
-                    self.on_reset()
+                callback = self.on_reset
+                if callback is not None:
+                    callback()
                 else:
                     self.set(False)
                 if self.debug_actors:
                     logger.info(f"Pin {self._pin} wurde automatisch zurückgesetzt", LogCategory.ACTOR)
             except Exception as e:
                 if self.debug_actors:
-                    logger.error(f"Fehler beim Auto-Reset von Pin {self._pin}: {e}", LogCategory.ACTOR)
-
-        self._reset_thread = threading.Thread(target=reset_callback, daemon=True)
-        self._reset_thread.start()
-
-        if self.debug_actors:
-            logger.debug(f"Pin {self._pin} → Reset-Timer gestartet: {self._reset_delay}s", LogCategory.ACTOR)
\ No newline at end of file
+                    logger.error(f"Fehler beim Auto-Reset von Pin {self._pin}: {e}", LogCategory.ACTOR)
\ No newline at end of file
@@ -1,125 +1,349 @@
 # io_control.py
 # Version: 3.1.0
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, NamedTuple, Mapping, Tuple
+from types import MappingProxyType
 import threading
 import time
 import select
 import sys
+import os
 
 from .io_actor import Actor
-from .io_sensor import Sensor
+from .io_sensor import Sensor, SensorPoller
 from .io_cover import Cover, CoverState
 from .logging_config import logger, LogCategory
 from .debug_mixin import DebugMixin
 
-class InputEvent:
-    """Repräsentiert ein Eingabe-Event"""
-    def __init__(self, source: str, action: str, target: str, value: any = None):
-        self.source = source
-        self.action = action
-        self.target = target
-        self.value = value
+# Zuordnungstabellen je Entity-Typ (statt if/elif-Ketten im Kommando-Pfad)
+_CMD_TO_STATE = {
+    'switch': {'ON': True, 'OFF': False},
+    'lock': {'UNLOCK': True, 'LOCK': False},
+}
+_STATE_TO_PAYLOAD = {
+    'switch': {True: 'ON', False: 'OFF'},
+    'lock': {True: 'UNLOCKED', False: 'LOCKED'},
+}
+_STATE_TO_COMMAND = {
+    'switch': {True: 'ON', False: 'OFF'},
+    'lock': {True: 'UNLOCK', False: 'LOCK'},
+    'button': {True: 'ON', False: 'ON'},  # Buttons senden immer ON
+}
+_VALUE_TO_COMMAND = {
+    'switch': {True: 'ON', False: 'OFF'},
+    'lock': {True: 'LOCK', False: 'UNLOCK'},
+    'button': {True: 'ON', False: 'ON'},
+}
+_COVER_ACTIONS = {'toggle': 'TOGGLE', 'open': 'OPEN', 'close': 'CLOSE', 'stop': 'STOP'}
+_COVER_METHODS = {'OPEN': 'open', 'CLOSE': 'close', 'STOP': 'stop', 'TOGGLE': 'toggle'}
 
-class InputHandler(ABC):
-    """Abstrakte Basisklasse für Input Handler"""
+def _intern(value):
+    """Interniert Strings aus der Konfiguration, damit Vergleiche mit Literalen per Identität greifen"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+class InputEvent(NamedTuple):
+    """Repräsentiert ein (unveränderliches) Eingabe-Event"""
+    source: str
+    action: str
+    target: str
+    value: Any = None
+
+class InputHandler:
+    """Basisklasse für Input Handler (Unterklassen überschreiben _handle_input)"""
     def __init__(self):
         self.observers: List[Callable[[InputEvent], None]] = []
+        self._observers_frozen: tuple = ()  # Unveränderliche Kopie für notify_observers
         self._running = False
+        self._stop_evt = threading.Event()  # Wird beim Beenden gesetzt, dient auch als Backoff-Timer
         self._thread = None
 
     def add_observer(self, observer: Callable[[InputEvent], None]):
         self.observers.append(observer)
+        self._freeze_observers()
+
+    def _freeze_observers(self):
+        """Aktualisiert die Observer-Kopie; bei genau einem Observer wird dieser direkt aufgerufen"""
+        self._observers_frozen = tuple(self.observers)
+        if len(self._observers_frozen) == 1:
+            self.notify_observers = self._observers_frozen[0]
+        else:
+            self.notify_observers = self._notify_many
 
     def notify_observers(self, event: InputEvent):
-        for observer in self.observers:
+        # Wird in _freeze_observers durch den einzelnen Observer bzw. _notify_many ersetzt
+        self._notify_many(event)
+
+    def _notify_many(self, event: InputEvent):
+        for observer in self._observers_frozen:
             observer(event)
 
-    @abstractmethod
-    def _handle_input(self):
+    def watch_stop_fd(self, fd: int):
+        """Registriert einen Dateideskriptor, dessen Lesbarkeit den Handler beendet (Standard: ignoriert)"""
         pass
 
+    def _handle_input(self):
+        raise NotImplementedError
+
     def start(self):
         if not self._running:
+            self._freeze_observers()
+            self._stop_evt.clear()
             self._running = True
             self._thread = threading.Thread(target=self._run, daemon=True)
             self._thread.start()
 
     def stop(self):
         self._running = False
+        self._stop_evt.set()
         if self._thread:
             self._thread.join(timeout=1)  # Warte maximal 1 Sekunde
 
     def _run(self):
-        while self._running:
+        while not self._stop_evt.is_set():
             self._handle_input()
+        self._running = False
 
 class SimpleInputHandler(InputHandler):
-    """Einfacher Input Handler basierend auf input() mit Timeout"""
-    def __init__(self, key_mappings: Dict[str, tuple]):
+    """Einfacher Input Handler basierend auf blockierendem Lesen von stdin"""
+    def __init__(self, key_mappings: Dict[str, tuple], use_epoll: bool = True):
+        """
+        :param key_mappings: Zuordnung Taste -> (Ziel, Aktion[, Wert]) bzw. Dict mit target/action/value
+        :param use_epoll: epoll verwenden, sofern verfügbar (sonst poll())
+        """
         super().__init__()
-        self.key_mappings = key_mappings
+        # Mappings nach dem Start einfrieren (schreibgeschützte Sicht, keine Kopie pro Zugriff)
+        self.key_mappings: Mapping[str, Any] = MappingProxyType(
+            {_intern(key): mapping for key, mapping in key_mappings.items()})
+        # Events einmalig erzeugen und bei jedem Tastendruck wiederverwenden
+        self._events: Mapping[str, InputEvent] = MappingProxyType(self._build_events(self.key_mappings))
+        # Menüzeilen (Taste, Beschreibung) einmalig für die Banner-Ausgabe aufbauen
+        self.menu_entries: Tuple[Tuple[str, str], ...] = tuple(
+            (key, f"{event.action.capitalize()} {event.target}") for key, event in self._events.items())
+        # Self-Pipe zum Aufwecken des blockierenden Wartens beim Beenden
+        self._wake_r, self._wake_w = os.pipe()
+        # stdin einmalig registrieren: epoll (level-triggered) unter Linux, sonst poll().
+        # Beide wiederholen bei EINTR (Signale wie SIGWINCH/SIGTERM) selbstständig.
+        self._stdin_fd = sys.stdin.fileno()
+        self._stop_fds = set()  # Stop-Pipes (z.B. des IOControllers), die den Handler beenden
+        self._pending = b''  # Noch nicht vollständig empfangene Zeile
+        self._use_epoll = use_epoll and hasattr(select, 'epoll')
+        if self._use_epoll:
+            self._poller = select.epoll()
+            try:
+                # Level-triggered: pro Weckruf wird nur einmal gelesen; weitere gepufferte
+                # Zeilen (z.B. beim Einfügen) melden sich beim nächsten poll() erneut
+                self._poller.register(self._stdin_fd, select.EPOLLIN)
+            except PermissionError:
+                # Reguläre Dateien (umgeleitetes stdin) unterstützen kein epoll
+                self._poller.close()
+                self._use_epoll = False
+            else:
+                self._poller.register(self._wake_r, select.EPOLLIN)
+        if not self._use_epoll:
+            self._poller = select.poll()
+            self._poller.register(self._stdin_fd, select.POLLIN)
+            self._poller.register(self._wake_r, select.POLLIN)
+
+    @staticmethod
+    def _build_events(key_mappings: Mapping[str, Any]) -> Dict[str, InputEvent]:
+        """Erzeugt aus den Key-Mappings die zugehörigen Events (ungültige Einträge werden ausgelassen)"""
+        events = {}
+        for key, mapping in key_mappings.items():
+            if isinstance(mapping, tuple) and len(mapping) >= 2:
+                target, action = mapping[0:2]
+                value = mapping[2] if len(mapping) > 2 else None
+            elif isinstance(mapping, dict):
+                target = mapping.get('target', 'system')
+                action = mapping.get('action', 'unknown')
+                value = mapping.get('value', None)
+            else:
+                continue
+            events[key] = InputEvent('input', _intern(action), _intern(target), _intern(value))
+        return events
+
+    def watch_stop_fd(self, fd: int):
+        """Nimmt die Stop-Pipe in das Warte-Set auf (level-triggered, damit jeder Handler sie sieht)"""
+        self._stop_fds.add(fd)
+        if self._use_epoll:
+            self._poller.register(fd, select.EPOLLIN)
+        else:
+            self._poller.register(fd, select.POLLIN)
+
+    def _handle_key(self, key: str):
+        """Verarbeitet eine eingegebene Zeile"""
+        if not key:  # Ignoriere leere Eingaben
+            return
+        if logger.debug_enabled:
+            logger.debug(f"Taste empfangen: {key}", LogCategory.SYSTEM)
+        event = self._events.get(key)
+        if event is not None:
+            if logger.debug_enabled:
+                logger.debug(f"Taste {key} ist in key_mappings", LogCategory.SYSTEM)
+            self.notify_observers(event)
+        elif key in self.key_mappings:
+            logger.error(f"Ungültiges Format für key_mapping: {self.key_mappings[key]}", LogCategory.SYSTEM)
+        elif logger.debug_enabled:
+            logger.debug(f"Taste {key} nicht in key_mappings!", LogCategory.SYSTEM)
+
+    def stop(self):
+        # Erst das Stop-Event setzen, damit der geweckte Thread die Schleife verlässt
+        self._stop_evt.set()
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+        super().stop()
+
+    def _read_stdin(self) -> bytes:
+        """Liest einmal von stdin (blockiert nicht, da poll() das fd als lesbar gemeldet hat)"""
+        return os.read(self._stdin_fd, 4096)
 
     def _handle_input(self):
         try:
-            # Prüfe, ob Eingabe verfügbar ist
-            if select.select([sys.stdin], [], [], 0.1)[0]:  # 100ms Timeout
-                key = sys.stdin.readline().strip()
-                if key:  # Ignoriere leere Eingaben
-                    logger.debug(f"Taste empfangen: {key}", LogCategory.SYSTEM)
-                    if key in self.key_mappings:
-                        logger.debug(f"Taste {key} ist in key_mappings", LogCategory.SYSTEM)
-                        if isinstance(self.key_mappings[key], tuple) and len(self.key_mappings[key]) >= 2:
-                            target, action = self.key_mappings[key][0:2]
-                            value = self.key_mappings[key][2] if len(self.key_mappings[key]) > 2 else None
-                        elif isinstance(self.key_mappings[key], dict):
-                            target = self.key_mappings[key].get('target', 'system')
-                            action = self.key_mappings[key].get('action', 'unknown')
-                            value = self.key_mappings[key].get('value', None)
-                        else:
-                            logger.error(f"Ungültiges Format für key_mapping: {self.key_mappings[key]}", LogCategory.SYSTEM)
-                            return
-                            
-                        event = InputEvent('input', action, target, value)
-                        self.notify_observers(event)
-                    else:
-                        logger.debug(f"Taste {key} nicht in key_mappings!", LogCategory.SYSTEM)
+            # Blockiert ohne Timeout, bis eine Eingabe oder ein Weckruf vorliegt
+            ready = {fd for fd, _ in self._poller.poll()}
+            if not self._stop_fds.isdisjoint(ready):
+                # Byte bleibt in der Pipe, damit auch alle anderen Handler geweckt werden
+                self._stop_evt.set()
+                return
+            if self._wake_r in ready:
+                os.read(self._wake_r, 512)
+                return
+            if self._stdin_fd in ready:
+                data = self._read_stdin()
+                if not data:  # EOF
+                    self._stop_evt.set()
+                    return
+                *lines, self._pending = (self._pending + data).split(b'\n')
+                for line in lines:
+                    self._handle_key(line.decode(errors='replace').strip())
         except EOFError:
-            self._running = False
+            self._stop_evt.set()
         except Exception as e:
-            logger.error(f"Fehler beim Lesen der Eingabe: {e}", LogCategory.SYSTEM)
-            if not self._running:  # Wenn wir uns im Shutdown befinden
+            if self._stop_evt.is_set():  # Wenn wir uns im Shutdown befinden
                 return
+            logger.error(f"Fehler beim Lesen der Eingabe: {e}", LogCategory.SYSTEM)
+            # Kurzer Backoff, damit ein dauerhafter Fehler die CPU nicht auslastet
+            self._stop_evt.wait(0.05)
 
 class IOController(DebugMixin):
     """Zentrale Steuerungsklasse für das IO-System"""
+    __slots__ = (
+        'actors', 'sensors', 'covers', 'input_handlers', '_shutdown', 'mqtt_handler',
+        'actor_states', 'cover_states', 'sensor_map',
+        '_state_topics', '_event_dispatch', '_cmd_dispatch', '_sensor_pins',
+        '_stop_r', '_stop_w', '_actors_view',
+    ) + DebugMixin._debug_slots
+
     def __init__(self, debug_config={}):
         self._init_debug_config(debug_config)
         self.actors: Dict[str, Actor] = {}
         self.sensors: Dict[str, Sensor] = {}
         self.covers: Dict[str, Cover] = {}  # Neu für Cover-Entitäten
         self.input_handlers: List[InputHandler] = []
-        self.running = False
+        # Gesetzt, solange der Controller nicht läuft; Hauptprogramme warten darauf statt zu pollen
+        self._shutdown = threading.Event()
+        self._shutdown.set()
         self.mqtt_handler = None
         self.actor_states = {}  # Speichert den letzten bekannten State jedes Actors
         self.cover_states = {}  # Speichert den letzten bekannten State jedes Covers
         self.sensor_map = {}    # Speichert zugeordnete Sensoren (z.B. für Cover)
+        self._state_topics: Dict[str, str] = {}  # Vorberechnete State-Topics je Actor
+        self._event_dispatch: Dict[str, Callable[[InputEvent], None]] = {}  # Event-Handler je Actor
+        self._cmd_dispatch: Dict[tuple, Callable[[], None]] = {}  # (Actor-ID, Kommando) -> Handler
+        self._sensor_pins: List[tuple] = []  # (GPIO-Nummer, Sensor) für die Sammelabfrage
+        self._actors_view: tuple = ()  # Unveränderliche Momentaufnahme von actors.items(), erneuert in add_actor()
+        
+        # Stop-Pipe: stop() weckt alle wartenden Handler sofort (Signal-Handler rufen stop() auf)
+        self._stop_r, self._stop_w = os.pipe()
+        os.set_blocking(self._stop_r, False)
+        os.set_blocking(self._stop_w, False)
+
+    @property
+    def running(self) -> bool:
+        """Gibt an, ob der Controller läuft"""
+        return not self._shutdown.is_set()
+
+    @running.setter
+    def running(self, value: bool):
+        # running = False (z.B. Quit-Taste) weckt alle Wartenden in wait_for_shutdown() sofort
+        if value:
+            self._shutdown.clear()
+        else:
+            self._shutdown.set()
+
+    @property
+    def actors_view(self) -> tuple:
+        """(Actor-ID, Actor)-Paare als Tupel, ohne bei jedem Zugriff eine dict-View zu erzeugen"""
+        return self._actors_view
+
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Blockiert, bis der Controller beendet wird (ersetzt Polling mit time.sleep)
+        
+        :param timeout: Maximale Wartezeit in Sekunden (None = unbegrenzt)
+        :return: True, wenn der Controller beendet wurde
+        """
+        return self._shutdown.wait(timeout)
 
     def add_actor(self, name: str, actor: Actor):
         """Fügt einen Actor hinzu"""
-        self.debug_system_process(f"Actor {name} hinzugefügt")
+        if self.debug_process:
+            self.debug_system_process(f"Actor {name} hinzugefügt")
         self.actors[name] = actor
+        self._actors_view = tuple(self.actors.items())
         self.actor_states[name] = actor.state  # Initialen Zustand speichern
 
     def add_sensor(self, name: str, sensor: Sensor):
         """Fügt einen Sensor hinzu"""
-        self.debug_system_process(f"Sensor {name} hinzugefügt")
+        if self.debug_process:
+            self.debug_system_process(f"Sensor {name} hinzugefügt")
         self.sensors[name] = sensor
+        self._sensor_pins.append((sensor.gpio_index, sensor))
+
+    def poll_all_sensors(self):
+        """Fragt alle Sensoren mit einer einzigen USB-Transaktion ab"""
+        if not self._sensor_pins:
+            return
+        from .mcp2221_patch import read_all_gpio
+        
+        try:
+            values = read_all_gpio()
+        except Exception as e:
+            self.debug_system_error("Fehler bei der GPIO-Sammelabfrage", e)
+            return
+        
+        for index, sensor in self._sensor_pins:
+            raw_value = values[index]
+            if raw_value is not None and not sensor.interrupt_enabled:
+                sensor.update_from_raw(raw_value)
+
+    def sync_poll_all(self) -> Dict[str, tuple]:
+        """Liest alle Sensoren mit einer einzigen USB-Transaktion (wie sync_poll_once je Sensor)
+        
+        :return: Sensor-ID -> (Rohwert, Zustand)
+        """
+        from .mcp2221_patch import read_all_gpio
+        
+        try:
+            values = read_all_gpio()
+        except Exception as e:
+            self.debug_system_error("Fehler bei der GPIO-Sammelabfrage", e)
+            # Rückfall auf die Einzelabfrage je Sensor
+            return {name: sensor.sync_poll_once() for name, sensor in self.sensors.items()}
+        
+        results = {}
+        for name, sensor in self.sensors.items():
+            raw_value = values[sensor.gpio_index]
+            if raw_value is None:
+                results[name] = (None, sensor.state)
+            else:
+                results[name] = (raw_value, sensor.update_from_raw(raw_value))
+        return results
 
     def add_cover(self, name: str, cover: Cover, sensor_open_id: str = None, sensor_closed_id: str = None):
         """Fügt ein Cover hinzu und verknüpft es mit Sensoren"""
-        self.debug_system_process(f"Cover {name} hinzugefügt")
+        if self.debug_process:
+            self.debug_system_process(f"Cover {name} hinzugefügt")
         self.covers[name] = cover
         self.cover_states[name] = cover.state  # Initialen Zustand speichern
         
@@ -138,6 +362,7 @@ class IOController(DebugMixin):
         """Fügt einen Input Handler hinzu"""
         self.debug_system_process("Input Handler wird hinzugefügt")
         handler.add_observer(self._handle_event)
+        handler.watch_stop_fd(self._stop_r)
         self.input_handlers.append(handler)
         handler.start()
         self.debug_system_process("Input Handler wurde gestartet")
@@ -146,15 +371,45 @@ class IOController(DebugMixin):
         """Startet den Controller"""
         self.debug_system_process("Starte Controller")
         self.running = True
+        self._drain_stop_pipe()
         for handler in self.input_handlers:
             handler.start()
+        for sensor in self.sensors.values():
+            sensor.start_polling()
 
     def stop(self):
         """Stoppt den Controller"""
         self.debug_system_process("Stoppe Controller")
         self.running = False
+        try:
+            os.write(self._stop_w, b'\0')  # Weckt alle Handler gleichzeitig
+        except OSError:
+            pass  # Pipe voll: Handler werden ohnehin geweckt
         for handler in self.input_handlers:
             handler.stop()
+        for sensor in self.sensors.values():
+            sensor.stop_polling()
+        # Gemeinsamen Polling-Thread beenden
+        SensorPoller.get_instance().stop()
+
+    def close(self):
+        """Stoppt den Controller und schließt die Stop-Pipe (danach ist kein erneuter Start möglich)"""
+        if self.running:
+            self.stop()
+        for fd in (self._stop_r, self._stop_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass  # Bereits geschlossen
+        self._stop_r = self._stop_w = -1
+
+    def _drain_stop_pipe(self):
+        """Entfernt alte Weckbytes aus der Stop-Pipe (z.B. nach einem vorherigen stop())"""
+        try:
+            while os.read(self._stop_r, 512):
+                pass
+        except BlockingIOError:
+            pass
 
     def initialize_covers(self):
         """Initialisiert alle Cover-Zustände basierend auf aktuellen Sensorzuständen"""
@@ -197,10 +452,22 @@ class IOController(DebugMixin):
         """Setzt den MQTT Handler und registriert Callbacks"""
         self.mqtt_handler = mqtt_handler
         
+        # State-Topics und Entity-Typen einmalig auflösen statt bei jedem Kommando
+        base = mqtt_handler.base_topic
+        self._state_topics = {aid: f"{base}/{aid}/state" for aid in self.actors}
+        actors_config = mqtt_handler.config['actors']
+        for aid, actor in self.actors.items():
+            # Vom MQTTHandler bereits klein geschrieben und interniert
+            actor.entity_type = actors_config.get(aid, {}).get('entity_type', 'switch')
+        
+        # Input-Events und MQTT-Kommandos je Actor vorab in fertige Funktionen übersetzen
+        self._build_event_dispatch()
+        self._build_command_dispatch()
+        
         # Für jeden Actor einen Callback registrieren
         for actor_id, actor in self.actors.items():
-            actor_config = mqtt_handler.config['actors'].get(actor_id, {})
-            entity_type = actor_config.get('entity_type', 'switch').lower()
+            actor_config = actors_config.get(actor_id, {})
+            entity_type = actor.entity_type
             
             self.debug_system_process(f"Registriere MQTT Command Callback für {actor_id}")
             mqtt_handler.register_command_callback(actor_id, self._handle_mqtt_command)
@@ -255,7 +522,12 @@ class IOController(DebugMixin):
             self._execute_actor_command(actor_id, command)
             
         # Für jeden Sensor einen Callback registrieren
+        sensors_config = mqtt_handler.config.get('sensors', {})
         for sensor_id, sensor in self.sensors.items():
+            poll_budget = sensors_config.get(sensor_id, {}).get('poll_budget')
+            if poll_budget is not None:
+                sensor.set_poll_budget(poll_budget)
+            
             def create_sensor_callback(sid):
                 def on_state_changed(state):
                     self.debug_sensor_state(sid, "state_change", f"Neuer Zustand: {state}")
@@ -296,6 +568,61 @@ class IOController(DebugMixin):
         # Initialisiere Cover-Zustände nach der Registrierung aller Callbacks
         self.initialize_covers()
 
+    def _build_event_dispatch(self):
+        """Erzeugt je Actor eine Funktion, die Input-Events direkt in MQTT-Kommandos übersetzt"""
+        publish_command = self.mqtt_handler.publish_command
+        self._event_dispatch = {}
+        
+        for actor_id, actor in self.actors.items():
+            entity_type = actor.entity_type
+            if entity_type not in _STATE_TO_COMMAND:
+                continue
+            
+            def create_event_dispatch(aid, a, toggle_map, value_map, cmd_map):
+                def dispatch_event(event):
+                    if event.action == 'toggle':
+                        command = toggle_map[not a.state]
+                    else:
+                        command = value_map[bool(event.value)]
+                        # Zielzustand bereits erreicht: kein Kommando (und damit kein HID-Write/Publish)
+                        if cmd_map is not None and cmd_map[command] == a.state:
+                            return
+                    publish_command(aid, command)
+                return dispatch_event
+            
+            # Buttons haben keinen Zielzustand und werden immer ausgelöst
+            self._event_dispatch[actor_id] = create_event_dispatch(
+                actor_id, actor, _STATE_TO_COMMAND[entity_type], _VALUE_TO_COMMAND[entity_type],
+                _CMD_TO_STATE.get(entity_type)
+            )
+
+    def _build_command_dispatch(self):
+        """Erzeugt je Actor und bekanntem Kommando eine Funktion mit vorberechnetem Zielzustand"""
+        self._cmd_dispatch = {}
+        
+        for actor_id, actor in self.actors.items():
+            entity_type = actor.entity_type
+            if entity_type == 'button':
+                def create_button_handler(aid, a):
+                    def press():
+                        self._press_button(aid, a)
+                    return press
+                self._cmd_dispatch[(actor_id, sys.intern("ON"))] = create_button_handler(actor_id, actor)
+                continue
+            
+            cmd_map = _CMD_TO_STATE.get(entity_type)
+            if cmd_map is None:
+                continue
+            
+            for command, new_state in cmd_map.items():
+                def create_command_handler(aid, a, state, payload):
+                    def execute():
+                        self._apply_actor_state(aid, a, state, payload)
+                    return execute
+                self._cmd_dispatch[(actor_id, sys.intern(command))] = create_command_handler(
+                    actor_id, actor, new_state, _STATE_TO_PAYLOAD[entity_type][new_state]
+                )
+
     def _update_related_covers(self, sensor_id: str, sensor_state: bool):
         """Aktualisiert die Zustände von Covers, die mit diesem Sensor verbunden sind"""
         if sensor_id not in self.sensor_map:
@@ -332,7 +659,8 @@ class IOController(DebugMixin):
 
     def _handle_mqtt_command(self, actor_id: str, command: str):
         """Verarbeitet MQTT-Kommandos"""
-        self.debug_system_process(f"MQTT Kommando empfangen: {actor_id} -> {command}")
+        if self.debug_process:
+            self.debug_system_process(f"MQTT Kommando empfangen: {actor_id} -> {command}")
         
         # Cover speziell behandeln
         if actor_id in self.covers:
@@ -341,8 +669,14 @@ class IOController(DebugMixin):
         
         if actor_id in self.actors:
             # Explizites Logging vor der Ausführung des Kommandos
-            self.debug_actor_state(actor_id, "mqtt_command_received", f"Kommando: {command}")
-            self._execute_actor_command(actor_id, command)
+            if self.debug_actors:
+                self.debug_actor_state(actor_id, "mqtt_command_received", f"Kommando: {command}")
+            handler = self._cmd_dispatch.get((actor_id, command))
+            if handler is not None:
+                handler()
+            else:
+                # Unbekannte Kommandos über den allgemeinen Pfad
+                self._execute_actor_command(actor_id, command)
         else:
             self.debug_system_error(f"Unbekannter Actor: {actor_id}")
 
@@ -355,19 +689,15 @@ class IOController(DebugMixin):
         cover = self.covers[cover_id]
         command = command.upper()
         
-        self.debug_system_process(f"Cover-Kommando: {cover_id} -> {command}")
+        if self.debug_process:
+            self.debug_system_process(f"Cover-Kommando: {cover_id} -> {command}")
         logger.info(f"Führe Kommando aus für {cover_id}: {command}", LogCategory.COVER)
         
-        if command == "OPEN":
-            cover.open()
-        elif command == "CLOSE":
-            cover.close()
-        elif command == "STOP":
-            cover.stop()
-        elif command == "TOGGLE":
-            # Immer einen neuen Impuls senden, unabhängig vom aktuellen Zustand
-            # Das ist wichtig für Garagentore, die über einen einfachen Impuls gesteuert werden
-            cover.toggle()
+        # TOGGLE sendet immer einen neuen Impuls, unabhängig vom aktuellen Zustand
+        # (wichtig für Garagentore, die über einen einfachen Impuls gesteuert werden)
+        method = _COVER_METHODS.get(command)
+        if method:
+            getattr(cover, method)()
         else:
             self.debug_system_error(f"Unbekanntes Cover-Kommando: {command}")
 
@@ -382,76 +712,63 @@ class IOController(DebugMixin):
             self.debug_system_error(f"MQTT Handler nicht konfiguriert - Kommando für {actor_id} kann nicht ausgeführt werden")
             return
             
-        actor_config = self.mqtt_handler.config['actors'].get(actor_id, {})
-        entity_type = actor_config.get('entity_type', 'switch').lower()
-        
-        self.debug_actor_state(actor_id, "execute_command", f"Kommando: {command}, Typ: {entity_type}")
+        entity_type = actor.entity_type
         
-        # Prüfen, ob sich der Zustand wirklich ändern würde
-        current_state = actor.state
-        new_state = False  # Standardwert
+        if self.debug_actors:
+            self.debug_actor_state(actor_id, "execute_command", f"Kommando: {command}, Typ: {entity_type}")
         
-        if entity_type == 'switch':
-            new_state = (command == "ON")
-        elif entity_type == 'lock':
-            new_state = (command == "UNLOCK")
-        elif entity_type == 'button':
-            new_state = True  # Buttons ändern ihren internen Zustand immer
+        # Buttons ändern ihren internen Zustand immer und haben kein State-Topic
+        if entity_type == 'button':
+            self._press_button(actor_id, actor)
+            return
         
+        cmd_map = _CMD_TO_STATE.get(entity_type)
+        if cmd_map is None:
+            return
+        new_state = cmd_map.get(command, False)
+        self._apply_actor_state(actor_id, actor, new_state, _STATE_TO_PAYLOAD[entity_type][new_state])
+
+    def _press_button(self, actor_id: str, actor: Actor):
+        """Löst einen Button-Actor aus"""
+        self.debug_actor_state(actor_id, "button_press", "Button gedrückt")
+        actor.set(True)  # Button ist nur kurz aktiv
+        self.actor_states[actor_id] = True  # Zustand merken
+
+    def _apply_actor_state(self, actor_id: str, actor: Actor, new_state: bool, payload: str):
+        """Setzt einen Actor auf den neuen Zustand und publiziert den State"""
         # Prüfen, ob der Zustand sich tatsächlich ändern würde
-        if current_state == new_state and entity_type != 'button':
-            self.debug_actor_state(
-                actor_id, 
-                "unchanged_state", 
-                f"Zustand unverändert: {current_state}, keine Aktion notwendig"
-            )
+        current_state = actor.state
+        if current_state == new_state:
+            if self.debug_actors:
+                self.debug_actor_state(
+                    actor_id, 
+                    "unchanged_state", 
+                    f"Zustand unverändert: {current_state}, keine Aktion notwendig"
+                )
             return
         
-        # Ab hier normaler Ablauf für Zustandsänderungen
-        if entity_type == 'switch':
-            # Physischen Zustand setzen
-            self.debug_actor_state(actor_id, "set_state", f"Kommando={command}, new_state={new_state}")
-            actor.set(new_state)
-            self.actor_states[actor_id] = new_state  # Zustand merken
-            
-            # MQTT updaten
-            if self.mqtt_handler:
-                # State Topic aktualisieren mit retain=True
-                self.mqtt_handler.mqtt_client.publish(
-                    f"{self.mqtt_handler.base_topic}/{actor_id}/state",
-                    command,
-                    qos=1,
-                    retain=True
-                )
-                self.debug_actor_state(actor_id, "mqtt_state", f"MQTT State: {command} (retained)")
-                
-        elif entity_type == 'lock':
-            # Analog zu switch: UNLOCK = ON (True)
-            self.debug_actor_state(actor_id, "set_state", f"Kommando={command}, new_state={new_state}")
-            actor.set(new_state)
-            self.actor_states[actor_id] = new_state  # Zustand merken
-            
-            # MQTT updaten
-            if self.mqtt_handler:
-                # State Topic aktualisieren mit retain=True
-                state = "UNLOCKED" if new_state else "LOCKED"
-                self.mqtt_handler.mqtt_client.publish(
-                    f"{self.mqtt_handler.base_topic}/{actor_id}/state",
-                    state,
-                    qos=1,
-                    retain=True
-                )
-                self.debug_actor_state(actor_id, "mqtt_state", f"MQTT State: {state} (retained)")
+        # Physischen Zustand setzen
+        if self.debug_actors:
+            self.debug_actor_state(actor_id, "set_state", f"State={payload}, new_state={new_state}")
+        actor.set(new_state)
+        self.actor_states[actor_id] = new_state  # Zustand merken
         
-        elif entity_type == 'button':
-            # Buttons haben kein MQTT-State-Topic, nur Command
-            self.debug_actor_state(actor_id, "button_press", "Button gedrückt")
-            actor.set(True)  # Button ist nur kurz aktiv
-            self.actor_states[actor_id] = True  # Zustand merken
+        # MQTT updaten (unveränderte Zustände wurden oben bereits abgefangen)
+        if self.mqtt_handler:
+            # State Topic aktualisieren mit retain=True (gebündelt über den PublishBatcher)
+            self.mqtt_handler.publish_batcher.publish(
+                self._state_topics[actor_id],
+                payload,
+                qos=1,
+                retain=True
+            )
+            if self.debug_actors:
+                self.debug_actor_state(actor_id, "mqtt_state", f"MQTT State: {payload} (retained)")
 
     def _handle_event(self, event: InputEvent):
         """Verarbeitet Events von Input Handlern"""
-        self.debug_system_process(f"Event empfangen: {event.source} -> {event.target}:{event.action}")
+        if self.debug_process:
+            self.debug_system_process(f"Event empfangen: {event.source} -> {event.target}:{event.action}")
         
         # Spezialbehandlung für System-Events
         if event.target == 'system':
@@ -462,68 +779,35 @@ class IOController(DebugMixin):
         
         # Cover-Events speziell behandeln
         if event.target in self.covers:
-            self.debug_system_process(f"Cover-Event verarbeiten: {event.target} -> {event.action}")
+            if self.debug_process:
+                self.debug_system_process(f"Cover-Event verarbeiten: {event.target} -> {event.action}")
             logger.info(f"Event empfangen: {event.target} -> {event.action}", LogCategory.COVER)
             
+            command = _COVER_ACTIONS.get(event.action, "TOGGLE")  # Fallback: TOGGLE
+            
             # Kommando über MQTT set senden
             if self.mqtt_handler:
-                if event.action == 'toggle':
-                    command = "TOGGLE"
-                elif event.action == 'open':
-                    command = "OPEN"
-                elif event.action == 'close':
-                    command = "CLOSE"
-                elif event.action == 'stop':
-                    command = "STOP"
-                else:
-                    command = "TOGGLE"  # Fallback
-                
                 # Direktes Logging, um die Ausführung zu verfolgen
                 logger.info(f"Sende Cover-Kommando an MQTT: {event.target} -> {command}", LogCategory.COVER)
                 self.mqtt_handler.publish_command(event.target, command)
             else:
                 # Wenn kein MQTT-Handler verfügbar ist, führe das Kommando direkt aus
                 logger.info(f"Führe Cover-Kommando direkt aus: {event.target} -> {event.action}", LogCategory.COVER)
-                if event.action == 'toggle':
-                    self.covers[event.target].toggle()
-                elif event.action == 'open':
-                    self.covers[event.target].open()
-                elif event.action == 'close':
-                    self.covers[event.target].close()
-                elif event.action == 'stop':
-                    self.covers[event.target].stop()
-                else:
-                    self.covers[event.target].toggle()  # Fallback
+                getattr(self.covers[event.target], _COVER_METHODS[command])()
             return
         
         # Normale Actor-Events über MQTT-Set routen
         if event.target in self.actors:
-            self.debug_actor_state(event.target, "input_event", f"Action: {event.action}")
+            if self.debug_actors:
+                self.debug_actor_state(event.target, "input_event", f"Action: {event.action}")
             
             if not self.mqtt_handler:
                 self.debug_system_error("MQTT Handler nicht verfügbar - Kommando kann nicht gesendet werden")
                 return
                 
-            actor_config = self.mqtt_handler.config['actors'].get(event.target, {})
-            entity_type = actor_config.get('entity_type', 'switch').lower()
-            
             # Kommando über MQTT set senden
-            if entity_type == 'switch':
-                if event.action == 'toggle':
-                    current_state = self.actors[event.target].state
-                    command = "OFF" if current_state else "ON"
-                else:
-                    command = "ON" if event.value else "OFF"
-            elif entity_type == 'button':
-                command = "ON"  # Buttons immer ON senden
-            elif entity_type == 'lock':
-                if event.action == 'toggle':
-                    current_state = self.actors[event.target].state
-                    command = "LOCK" if current_state else "UNLOCK"
-                else:
-                    command = "LOCK" if event.value else "UNLOCK"
-            else:
-                self.debug_system_error(f"Unbekannter Entity-Typ: {entity_type}")
+            dispatch_event = self._event_dispatch.get(event.target)
+            if dispatch_event is None:
+                self.debug_system_error(f"Unbekannter Entity-Typ: {self.actors[event.target].entity_type}")
                 return
-            
-            self.mqtt_handler.publish_command(event.target, command)
\ No newline at end of file
+            dispatch_event(event)
\ No newline at end of file
@@ -65,6 +65,7 @@ class Cover(DebugMixin):
         # Bewegungsmonitoring
         self._movement_monitor_thread = None
         self._movement_monitor_running = False
+        self._movement_stop = threading.Event()  # Beendet das Monitoring sofort
         
         # Callbacks
         self._state_changed_callback = None
@@ -244,11 +245,11 @@ class Cover(DebugMixin):
         else:
             # Wenn beide Sensoren inaktiv sind, leiten wir die Bewegungsrichtung 
             # aus dem vorherigen Zustand ab
-            if old_state == CoverState.OPEN or old_state == CoverState.OPENING:
+            if old_state is CoverState.OPEN or old_state is CoverState.OPENING:
                 logger.info(f"Cover Status-Logik: closed={closed_state}, open={open_state}, " 
                           f"vorheriger Zustand={old_state} → CLOSING", LogCategory.COVER)
                 return CoverState.CLOSING
-            elif old_state == CoverState.CLOSED or old_state == CoverState.CLOSING:
+            elif old_state is CoverState.CLOSED or old_state is CoverState.CLOSING:
                 logger.info(f"Cover Status-Logik: closed={closed_state}, open={open_state}, " 
                           f"vorheriger Zustand={old_state} → OPENING", LogCategory.COVER)
                 return CoverState.OPENING
@@ -276,22 +277,26 @@ class Cover(DebugMixin):
         # Monitoring stoppen, wenn der neue Zustand keine Bewegung ist
         elif self._movement_monitor_running:
             self._movement_monitor_running = False
-            
-            if self._movement_monitor_thread and self._movement_monitor_thread.is_alive():
-                # Thread wird sich selbst beenden, wenn _movement_monitor_running auf False gesetzt ist
-                pass
+            # Wartenden Monitor-Thread sofort wecken, damit er sich beendet
+            self._movement_stop.set()
     
     def _start_movement_monitoring(self):
         """Startet das Bewegungs-Monitoring in einem separaten Thread"""
         self._movement_monitor_running = True
+        self._movement_stop.clear()
         
         def monitor_movement():
             self.debug_cover_state("monitor", "Bewegungs-Monitoring gestartet")
             
             while self._movement_monitor_running:
-                # Prüfen, ob Timeout überschritten wurde
-                current_time = time.monotonic()
-                if (current_time - self._last_action_time) > self._movement_timeout:
+                # Bis zur Timeout-Deadline warten (neu berechnet, falls eine neue Aktion erfolgt ist)
+                remaining = self._last_action_time + self._movement_timeout - time.monotonic()
+                if remaining > 0:
+                    if self._movement_stop.wait(remaining):
+                        break
+                    continue
+                
+                if self._movement_monitor_running:
                     logger.warning(f"Cover Bewegungs-Timeout überschritten! "
                                   f"State={self._state}, Zeit={self._movement_timeout}s", 
                                   LogCategory.COVER)
@@ -314,9 +319,6 @@ class Cover(DebugMixin):
                     # Monitoring beenden
                     self._movement_monitor_running = False
                     break
-                
-                # Kurze Pause
-                time.sleep(1.0)
             
             self.debug_cover_state("monitor", "Bewegungs-Monitoring beendet")
         
@@ -374,7 +376,7 @@ class Cover(DebugMixin):
         self._actor.set(True)
         
         # Für Cover in geschlossenem Zustand den Zustand direkt auf OPENING setzen
-        if self._state == CoverState.CLOSED:
+        if self._state is CoverState.CLOSED:
             # Bei einem direkten Befehl setzen wir die Verifizierung zurück
             self._verification_count = 0
             self._unstable_readings_count = 0
@@ -405,7 +407,7 @@ class Cover(DebugMixin):
         self._actor.set(True)
         
         # Für Cover in geöffnetem Zustand den Zustand direkt auf CLOSING setzen
-        if self._state == CoverState.OPEN:
+        if self._state is CoverState.OPEN:
             # Bei einem direkten Befehl setzen wir die Verifizierung zurück
             self._verification_count = 0
             self._unstable_readings_count = 0
@@ -467,7 +469,7 @@ class Cover(DebugMixin):
         # Zustand basierend auf dem aktuellen Status ändern (Vorhersage der nächsten Bewegung)
         old_state = self._state
         
-        if self._state == CoverState.CLOSED:
+        if self._state is CoverState.CLOSED:
             # Wenn geschlossen, sollte es sich öffnen
             self._state = CoverState.OPENING
             
@@ -476,7 +478,7 @@ class Cover(DebugMixin):
             self._unstable_readings_count = 0
             self._last_verified_reading = (self._sensor_open_state, False)
             
-        elif self._state == CoverState.OPEN:
+        elif self._state is CoverState.OPEN:
             # Wenn geöffnet, sollte es sich schließen
             self._state = CoverState.CLOSING
             
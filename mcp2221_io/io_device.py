@@ -1,5 +1,6 @@
 # io_device.py
 
+import operator
 from enum import Enum, auto
 from typing import Optional, Callable
 
@@ -10,6 +11,8 @@ class IOMode(Enum):
     TOGGLE = auto()
 
 class IODevice:
+    __slots__ = ('_pin', '_inverted', '_state', '_state_raw', '_convert')
+
     def __init__(self, pin: str, inverted: bool = False):
         """
         Initialisiert ein IO-Gerät
@@ -22,6 +25,9 @@ class IODevice:
         self._state: bool = False
         self._state_raw: bool = False
 
+        # Invertierung einmalig als Funktion festlegen (kein Branch pro Lese-/Schreibzugriff)
+        self._convert: Callable[[bool], bool] = operator.not_ if inverted else bool
+
     @property
     def pin(self) -> str:
         """Gibt den Pin des Geräts zurück"""
@@ -30,7 +36,7 @@ class IODevice:
     @property
     def state(self) -> bool:
         """Gibt den logischen Zustand des Geräts zurück"""
-        return not self._state if self._inverted else self._state 
+        return self._convert(self._state)
     
     @property
     def state_raw(self) -> bool:
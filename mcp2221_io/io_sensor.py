@@ -1,24 +1,181 @@
 # io_sensor.py
 # Version: 2.0.0
 
+import array
+import board
 import digitalio
+import heapq
+import itertools
+import logging
+import threading
 import time
-from typing import Optional, Callable, Dict, Any, Tuple
+from typing import Optional, Callable, Dict, Any, Tuple, List
 
 from .io_device import IODevice
 from .debug_mixin import DebugMixin
 from .logging_config import logger, LogCategory
 
+# Pin-Objekte des Boards einmalig auflösen (Name -> Pin), statt getattr(board, ...) pro Sensor
+_PIN_LUT = {name: getattr(board, name) for name in dir(board) if not name.startswith('_')}
+
+# Bestätigte Zustände aller Sensoren als zusammenhängendes Byte-Array (Index = Sensor.state_index).
+# Jeder Eintrag wird nur vom jeweiligen Abfrage-Thread geschrieben; ein einzelner Item-Store auf
+# array.array ist unter dem GIL atomar, daher brauchen weder Schreiber noch Leser ein Lock.
+_sensor_states = array.array('b')
+_sensor_states_lock = threading.Lock()  # Nur für das Anlegen neuer Einträge
+
+def _allocate_state_index() -> int:
+    """Reserviert einen Eintrag in _sensor_states und gibt dessen Index zurück"""
+    with _sensor_states_lock:
+        _sensor_states.append(0)
+        return len(_sensor_states) - 1
+
+def sensor_states() -> bytes:
+    """Gibt eine Momentaufnahme der Zustände aller Sensoren zurück
+    
+    Bewusst eine Kopie: eine offene memoryview würde das Anlegen weiterer Sensoren
+    (Vergrößern des Arrays) mit BufferError blockieren.
+    """
+    return _sensor_states.tobytes()
+
+# Histogramm der Abstände zwischen bestätigten Zustandsänderungen (adaptives Polling).
+# Bin 0 deckt [0, U) ab, Bin b >= 1 deckt [U * 2^(b-1), U * 2^b) ab (U = poll_interval);
+# das letzte Bin ist nach oben offen.
+_HIST_BINS = 24
+_HIST_MIN_SAMPLES = 3     # Darunter wird mit festem Intervall U abgetastet
+_HIST_MAX_SAMPLES = 256   # Darüber werden alle Zähler halbiert, ältere Abstände verlieren Gewicht
+
+class SensorPoller:
+    """
+    Gemeinsamer Polling-Thread für alle Sensoren.
+    
+    Die Sensoren liegen nach ihrem nächsten Abfragezeitpunkt sortiert in einem Min-Heap.
+    Alle Sensoren, die innerhalb von BATCH_WINDOW fällig sind, werden mit einer einzigen
+    GET-GPIO-VALUES-Abfrage des MCP2221 gelesen.
+    """
+    BATCH_WINDOW = 0.001  # Sekunden
+    _instance = None
+    
+    @classmethod
+    def get_instance(cls) -> 'SensorPoller':
+        """Singleton-Instanz zurückgeben"""
+        if cls._instance is None:
+            cls._instance = SensorPoller()
+        return cls._instance
+    
+    def __init__(self):
+        # Min-Heap aus (Deadline (monotonic), Sequenz, Sensor)
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_evt = threading.Event()  # Je Thread ein eigenes Event
+    
+    def register(self, sensor: 'Sensor'):
+        """Nimmt einen Sensor in das Polling auf"""
+        with self._cv:
+            heapq.heappush(self._heap, (time.monotonic() + sensor.poll_interval, next(self._sequence), sensor))
+            if self._thread is None:
+                self._stop_evt = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop_evt,),
+                                                name="SensorPoller", daemon=True)
+                self._thread.start()
+            self._cv.notify()
+    
+    def unregister(self, sensor: 'Sensor'):
+        """Entfernt einen Sensor aus dem Polling"""
+        with self._cv:
+            self._heap = [entry for entry in self._heap if entry[2] is not sensor]
+            heapq.heapify(self._heap)
+    
+    def stop(self):
+        """Beendet den Polling-Thread; ein erneutes register() startet ihn wieder"""
+        with self._cv:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stop_evt.set()
+            self._heap.clear()
+            self._thread = None
+            self._cv.notify()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+    
+    def _run(self, stop_evt: threading.Event):
+        while True:
+            with self._cv:
+                while True:
+                    if stop_evt.is_set():
+                        return
+                    if not self._heap:
+                        self._cv.wait()
+                        continue
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._cv.wait(timeout)
+                
+                # Alle (nahezu) gleichzeitig fälligen Sensoren zusammenfassen
+                limit = self._heap[0][0] + self.BATCH_WINDOW
+                due = []
+                while self._heap and self._heap[0][0] <= limit:
+                    due.append(heapq.heappop(self._heap))
+            
+            self._poll(due)
+            
+            with self._cv:
+                if stop_evt.is_set():
+                    return
+                now = time.monotonic()
+                for deadline, _, sensor in due:
+                    if not sensor.polling:
+                        continue
+                    # Gegen die vorherige Deadline planen; verpasste Termine werden übersprungen
+                    interval = sensor.next_poll_interval(now)
+                    next_deadline = deadline + interval
+                    if next_deadline < now:
+                        next_deadline = now + interval
+                    heapq.heappush(self._heap, (next_deadline, next(self._sequence), sensor))
+    
+    def _poll(self, due: List[tuple]):
+        """Liest die fälligen Sensoren mit einer Sammelabfrage (Fallback: einzeln)"""
+        try:
+            from .mcp2221_patch import read_all_gpio
+            values = read_all_gpio()
+        except Exception:
+            values = None
+        
+        for _, _, sensor in due:
+            if sensor.interrupt_enabled:
+                continue
+            try:
+                raw_value = values[sensor.gpio_index] if values is not None else None
+                if raw_value is None:
+                    sensor.sync_poll_once()
+                else:
+                    sensor.update_from_raw(raw_value)
+            except Exception as e:
+                logger.error(f"{sensor.name} - Fehler beim Polling: {e}", LogCategory.SENSOR)
+
 class Sensor(IODevice, DebugMixin):
     """Repräsentiert einen Sensor mit GPIO-Eingang"""
     
+    __slots__ = (
+        '_poll_interval', '_debounce_time', '_stable_readings',
+        '_last_raw', '_stable_count', '_last_debounce', '_state_changed_callback',
+        '_pin_id', '_sensor_name', '_gpio_pin', '_digital_pin',
+        '_ioc_edge', '_ioc_running', '_ioc_stop', '_ioc_thread', '_polling', '_state_index',
+        '_poll_budget', '_change_hist', '_change_total', '_last_change',
+    ) + DebugMixin._debug_slots
+    
     def __init__(
         self, 
         pin: str, 
         inverted: bool = False, 
         poll_interval: float = 0.1, 
         debug_config: Dict = None,
-        name: str = None
+        name: str = None,
+        poll_budget: int = 1
     ):
         """
         Initialisiert einen Sensor
@@ -28,8 +185,11 @@ class Sensor(IODevice, DebugMixin):
         :param poll_interval: Abtastintervall in Sekunden
         :param debug_config: Debug-Konfiguration
         :param name: Optionaler Name/ID für den Sensor
+        :param poll_budget: Faktor k für adaptives Polling (poll_interval ist die Obergrenze,
+                            poll_interval / k das kürzeste Intervall; 1 = festes Intervall)
         """
-        import board
+        # Muss vor IODevice.__init__ stehen, da dort bereits _state geschrieben wird
+        self._state_index = _allocate_state_index()
         IODevice.__init__(self, pin, inverted)
         self._init_debug_config(debug_config or {})
         
@@ -37,6 +197,7 @@ class Sensor(IODevice, DebugMixin):
         self._poll_interval = poll_interval
         self._debounce_time = 0.05
         self._stable_readings = 3
+        self._poll_budget = max(1, int(poll_budget))
         
         # Zustand
         self._state = False
@@ -45,12 +206,26 @@ class Sensor(IODevice, DebugMixin):
         self._last_debounce = time.monotonic()
         self._state_changed_callback = None
         
+        # Änderungshistorie für adaptives Polling
+        self._change_hist = [0] * _HIST_BINS
+        self._change_total = 0
+        self._last_change: Optional[float] = None
+        
         # GPIO-Konfiguration
         self._pin_id = pin
         self._sensor_name = name or pin  # Verwende den Namen, falls angegeben, sonst Pin
-        self._gpio_pin = getattr(board, pin)
+        self._gpio_pin = _PIN_LUT[pin]
         self._digital_pin = digitalio.DigitalInOut(self._gpio_pin)
         self._digital_pin.direction = digitalio.Direction.INPUT
+        
+        # Interrupt-on-Change (nur GP1 des MCP2221)
+        self._ioc_edge: Optional[str] = None
+        self._ioc_running = False
+        self._ioc_stop = threading.Event()
+        self._ioc_thread: Optional[threading.Thread] = None
+        
+        # Hintergrund-Polling über den gemeinsamen SensorPoller
+        self._polling = False
 
     def set_debounce_time(self, seconds: float):
         """
@@ -70,6 +245,62 @@ class Sensor(IODevice, DebugMixin):
         self._stable_readings = count
         self.debug_sensor_state(self._pin_id, "config", f"Stabile Lesungen auf {count} gesetzt")
 
+    def set_poll_budget(self, budget: int):
+        """
+        Setzt den Faktor k für adaptives Polling
+        
+        :param budget: poll_interval / budget ist das kürzeste Abtastintervall (1 = festes Intervall)
+        """
+        self._poll_budget = max(1, int(budget))
+        self.debug_sensor_state(self._pin_id, "config", f"Poll-Budget auf {self._poll_budget} gesetzt")
+
+    def record_change(self, timestamp: float):
+        """
+        Trägt den Abstand zur vorherigen bestätigten Zustandsänderung in das Histogramm ein
+        
+        :param timestamp: Zeitpunkt der Änderung (time.monotonic())
+        """
+        last = self._last_change
+        self._last_change = timestamp
+        if last is None:
+            return
+        hist = self._change_hist
+        hist[min(int((timestamp - last) / self._poll_interval).bit_length(), _HIST_BINS - 1)] += 1
+        self._change_total += 1
+        if self._change_total > _HIST_MAX_SAMPLES:
+            for i in range(_HIST_BINS):
+                hist[i] >>= 1
+            self._change_total = sum(hist)
+
+    def next_poll_interval(self, now: float) -> float:
+        """
+        Berechnet das Intervall bis zur nächsten Abfrage.
+        
+        Mit S = Anteil der Änderungsabstände, die noch nicht verstrichen sind, und f = Dichte
+        des Histogramms an der aktuellen Stelle gilt Intervall = S / (k * f): dort, wo Änderungen
+        gehäuft auftreten, wird schneller abgetastet. Ergebnis liegt in [poll_interval / k, poll_interval].
+        
+        :param now: Aktueller Zeitpunkt (time.monotonic())
+        :return: Intervall in Sekunden
+        """
+        upper = self._poll_interval
+        budget = self._poll_budget
+        if budget <= 1:
+            return upper
+        lower = upper / budget
+        # Unbestätigte Änderung: schnell weiter abtasten, damit das Entprellen nicht pro Lesung U dauert
+        if self._last_raw is not None and self._last_raw != self._state:
+            return lower
+        if self._change_total < _HIST_MIN_SAMPLES or self._last_change is None:
+            return upper
+        hist = self._change_hist
+        b = min(int((now - self._last_change) / upper).bit_length(), _HIST_BINS - 1)
+        if not hist[b]:
+            return upper
+        width = upper if b == 0 else upper * (1 << (b - 1))
+        interval = sum(hist[b:]) * width / (budget * hist[b])
+        return min(upper, max(lower, interval))
+
     def set_state_changed_callback(self, callback: Callable[[bool], None]):
         """
         Setzt den Callback für Zustandsänderungen
@@ -99,7 +330,7 @@ class Sensor(IODevice, DebugMixin):
         """
         try:
             raw_value = self._digital_pin.value
-            read_state = not raw_value if self._inverted else raw_value
+            read_state = self._convert(raw_value)
             result = {
                 "pin": self._pin_id,
                 "name": self._sensor_name,
@@ -132,6 +363,61 @@ class Sensor(IODevice, DebugMixin):
 
     
 
+    @property
+    def _state(self) -> bool:
+        """Bestätigter Zustand, abgelegt in _sensor_states (lock-frei, siehe dort)"""
+        return bool(_sensor_states[self._state_index])
+
+    @_state.setter
+    def _state(self, value: bool):
+        _sensor_states[self._state_index] = value
+
+    @property
+    def state_index(self) -> int:
+        """Gibt den Index des Sensors in sensor_states() zurück"""
+        return self._state_index
+
+    @property
+    def name(self) -> str:
+        """Gibt den Namen des Sensors zurück"""
+        return self._sensor_name
+
+    @property
+    def poll_interval(self) -> float:
+        """Gibt das Abtastintervall in Sekunden zurück"""
+        return self._poll_interval
+
+    @property
+    def polling(self) -> bool:
+        """Gibt an, ob der Sensor im Hintergrund abgefragt wird"""
+        return self._polling
+
+    def start_polling(self):
+        """Startet das Hintergrund-Polling über den gemeinsamen SensorPoller"""
+        if self._polling:
+            return
+        self._polling = True
+        SensorPoller.get_instance().register(self)
+        self.debug_sensor_state(self._sensor_name, "poll", f"Polling gestartet ({self._poll_interval}s)")
+
+    def stop_polling(self):
+        """Beendet das Hintergrund-Polling"""
+        if not self._polling:
+            return
+        self._polling = False
+        SensorPoller.get_instance().unregister(self)
+        self.debug_sensor_state(self._sensor_name, "poll", "Polling beendet")
+
+    @property
+    def gpio_index(self) -> int:
+        """Gibt die Nummer des GPIOs (GP0..GP3) zurück"""
+        return self._gpio_pin.id
+
+    @property
+    def interrupt_enabled(self) -> bool:
+        """Gibt an, ob der Sensor über Interrupt-on-Change statt Polling arbeitet"""
+        return self._ioc_running
+
     def sync_poll_once(self) -> Tuple[Optional[bool], bool]:
         """
         Führt eine einzelne Abfrage des Sensors durch.
@@ -140,24 +426,33 @@ class Sensor(IODevice, DebugMixin):
         """
         try:
             raw_value = self._digital_pin.value
-            processed_state = self._check_and_update_state(raw_value)
-            
-            # Verbesserte Debug-Ausgabe
-            if self.debug_sensors:
-                state_str = "ON" if processed_state else "OFF"
-                raw_str = "HIGH" if raw_value else "LOW"
-                self.debug_sensor_state(
-                    self._sensor_name, 
-                    "poll", 
-                    f"Raw={raw_str}, State={state_str}, Stabil={self._stable_count}/{self._stable_readings}"
-                )
-                
-            return raw_value, processed_state
+            return raw_value, self.update_from_raw(raw_value)
         except Exception as e:
             self.debug_sensor_error(self._sensor_name, "Fehler beim Polling", e)
             # Bei Fehler den letzten bekannten Zustand beibehalten
             return None, self._state
 
+    def update_from_raw(self, raw_value: bool) -> bool:
+        """
+        Verarbeitet einen bereits gelesenen Rohwert (z.B. aus einer Sammelabfrage).
+        
+        :param raw_value: Der Rohwert vom Pin
+        :return: Der verarbeitete Zustand
+        """
+        processed_state = self._check_and_update_state(raw_value)
+        
+        # Verbesserte Debug-Ausgabe
+        if self.debug_sensors:
+            state_str = "ON" if processed_state else "OFF"
+            raw_str = "HIGH" if raw_value else "LOW"
+            self.debug_sensor_state(
+                self._sensor_name, 
+                "poll", 
+                f"Raw={raw_str}, State={state_str}, Stabil={self._stable_count}/{self._stable_readings}"
+            )
+            
+        return processed_state
+
     def _check_and_update_state(self, raw_value: bool) -> bool:
         """
         Überprüft und aktualisiert den Zustand basierend auf dem Rohwert.
@@ -168,7 +463,7 @@ class Sensor(IODevice, DebugMixin):
         :return: Der aktuelle Zustand (möglicherweise aktualisiert)
         """
         # Konvertiere den Rohwert unter Berücksichtigung der Invertierung
-        read_state = not raw_value if self._inverted else raw_value
+        read_state = self._convert(raw_value)
         now = time.monotonic()
 
         if self._last_raw is None:
@@ -176,15 +471,19 @@ class Sensor(IODevice, DebugMixin):
             self._last_debounce = now
             self._last_raw = read_state
             self._stable_count = 1
-            self.debug_sensor_state(self._sensor_name, "init", f"Erste Lesung: {read_state}")
-            logger.info(f"{self._sensor_name} - Erste Lesung: Raw={raw_value}, Read={read_state}", LogCategory.SENSOR)
+            if self.debug_sensors:
+                self.debug_sensor_state(self._sensor_name, "init", f"Erste Lesung: {read_state}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"{self._sensor_name} - Erste Lesung: Raw={raw_value}, Read={read_state}", LogCategory.SENSOR)
         elif read_state != self._last_raw:
             # Zustandsänderung - Debounce-Timer zurücksetzen
             self._last_debounce = now
             self._last_raw = read_state
             self._stable_count = 1
-            self.debug_sensor_state(self._sensor_name, "change", f"Zustandsänderung: {self._state} -> {read_state}")
-            logger.info(f"{self._sensor_name} - Zustandsänderung erkannt: {self._state} -> {read_state}, Debounce-Timer zurückgesetzt", LogCategory.SENSOR)
+            if self.debug_sensors:
+                self.debug_sensor_state(self._sensor_name, "change", f"Zustandsänderung: {self._state} -> {read_state}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"{self._sensor_name} - Zustandsänderung erkannt: {self._state} -> {read_state}, Debounce-Timer zurückgesetzt", LogCategory.SENSOR)
         elif now - self._last_debounce >= self._debounce_time:
             # Zustand ist stabil für Debounce-Zeit - Zähler erhöhen
             self._stable_count += 1
@@ -197,7 +496,7 @@ class Sensor(IODevice, DebugMixin):
                 )
             
             # Zusätzliches INFO-Logging, wenn wir uns dem Schwellenwert nähern
-            if self._stable_count >= self._stable_readings - 1:
+            if self._stable_count >= self._stable_readings - 1 and logger.isEnabledFor(logging.INFO):
                 logger.info(f"{self._sensor_name} - Fast stabile Lesung: {self._stable_count}/{self._stable_readings}, "
                            f"Aktueller Zustand={self._state}, Neuer Zustand={read_state}", LogCategory.SENSOR)
 
@@ -205,6 +504,7 @@ class Sensor(IODevice, DebugMixin):
         if self._stable_count >= self._stable_readings and read_state != self._state:
             old_state = self._state
             self._state = read_state
+            self.record_change(now)
             
             if self.debug_sensors:
                 self.debug_sensor_state(
@@ -239,7 +539,7 @@ class Sensor(IODevice, DebugMixin):
         """
         try:
             raw_value = self._digital_pin.value
-            read_state = not raw_value if self._inverted else raw_value
+            read_state = self._convert(raw_value)
             old_state = self._state
             
             # Zustand direkt aktualisieren ohne Debouncing
@@ -261,4 +561,87 @@ class Sensor(IODevice, DebugMixin):
             return self._state
         except Exception as e:
             logger.error(f"{self._sensor_name} - Fehler bei erzwungener Aktualisierung: {e}", LogCategory.SENSOR)
-            return self._state
\ No newline at end of file
+            return self._state
+
+    def enable_interrupt(self, edge: str = 'rising', callback: Optional[Callable[[bool], None]] = None):
+        """
+        Aktiviert die Interrupt-Erkennung (IOC) des MCP2221 für diesen Sensor.
+        
+        Statt den Pin-Pegel zyklisch zu lesen, wird nur noch das Interrupt-Flag
+        über eine einzelne Status-Abfrage geprüft. Der Zustand wird nur bei einer
+        erkannten Flanke aktualisiert; der Pegel wird dann nachgelesen. Nur für Pin G1 verfügbar.
+        
+        :param edge: 'rising', 'falling' oder 'both' (bezogen auf den Rohwert; 'both' nur auf Wunsch,
+                     da prellende Kontakte dann bei jeder Flanke eine zusätzliche Pegelabfrage auslösen)
+        :param callback: Optionaler Callback für Zustandsänderungen
+        """
+        from .mcp2221_patch import enable_gp1_interrupt, IOC_PIN
+        
+        if self._pin_id != f"G{IOC_PIN}":
+            raise ValueError(f"Interrupt-on-Change ist nur auf G{IOC_PIN} verfügbar, nicht auf {self._pin_id}")
+        if edge not in ('rising', 'falling', 'both'):
+            raise ValueError(f"Ungültige Flanke: {edge}")
+        if self._ioc_running:
+            return
+        
+        if callback is not None:
+            self._state_changed_callback = callback
+        
+        # Ausgangszustand lesen, solange der Pin noch als GPIO konfiguriert ist
+        self.force_update()
+        
+        self._digital_pin.deinit()
+        enable_gp1_interrupt(rising=edge != 'falling', falling=edge != 'rising')
+        self._ioc_edge = edge
+        self._ioc_stop.clear()
+        self._ioc_running = True
+        self._ioc_thread = threading.Thread(target=self._watch_interrupt, daemon=True)
+        self._ioc_thread.start()
+        self.debug_sensor_state(self._sensor_name, "ioc", f"Interrupt-Erkennung aktiviert ({edge})")
+
+    def disable_interrupt(self):
+        """Deaktiviert die Interrupt-Erkennung und stellt den GPIO-Eingang wieder her"""
+        from .mcp2221_patch import disable_gp1_interrupt
+        
+        if not self._ioc_running:
+            return
+        self._ioc_running = False
+        self._ioc_stop.set()
+        if self._ioc_thread:
+            self._ioc_thread.join(timeout=1)
+        disable_gp1_interrupt()
+        self._digital_pin = digitalio.DigitalInOut(self._gpio_pin)
+        self._digital_pin.direction = digitalio.Direction.INPUT
+        self._ioc_edge = None
+        self.debug_sensor_state(self._sensor_name, "ioc", "Interrupt-Erkennung deaktiviert")
+
+    def _watch_interrupt(self):
+        """Prüft das Interrupt-Flag und aktualisiert den Zustand nur bei erkannten Flanken"""
+        from .mcp2221_patch import read_and_clear_interrupt_flag, read_ioc_pin_level
+        
+        # Abfragen an festen Deadlines ausrichten, damit die USB-Latenz das Intervall nicht verlängert
+        next_deadline = time.monotonic()
+        while not self._ioc_stop.is_set():
+            try:
+                if read_and_clear_interrupt_flag():
+                    # Das Flag ist nur ein Latch: Prellen oder mehrere Flanken zwischen zwei Abfragen
+                    # lassen sich daraus nicht ableiten, daher immer den tatsächlichen Pegel nachlesen
+                    raw_value = read_ioc_pin_level()
+                    new_state = self._convert(raw_value)
+                    
+                    if new_state != self._state:
+                        self._state = new_state
+                        self._last_raw = new_state
+                        if self.debug_sensors:
+                            self.debug_sensor_state(self._sensor_name, "ioc", f"Flanke erkannt, neuer Zustand: {new_state}")
+                        if self._state_changed_callback:
+                            self._state_changed_callback(new_state)
+            except Exception as e:
+                self.debug_sensor_error(self._sensor_name, "Fehler bei der Interrupt-Abfrage", e)
+            
+            next_deadline += self._poll_interval
+            wait_for = next_deadline - time.monotonic()
+            if wait_for <= 0:
+                next_deadline = time.monotonic()  # Verpasste Termine nicht nachholen
+            elif self._ioc_stop.wait(wait_for):
+                break
\ No newline at end of file
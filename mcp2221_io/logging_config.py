@@ -1,7 +1,10 @@
 # logging_config.py
 # Version: 2.0.0
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from enum import Enum
@@ -87,7 +90,32 @@ class Logger:
             # Filter nur im Nicht-Debug-Modus aktivieren
             # self.console_handler.addFilter(LogFilter())
         
-        self.logger.addHandler(self.console_handler)
+        self.log_queue = None
+        self.queue_handler = None
+        self.listener = None
+        if sys.stdin is not None and sys.stdin.isatty():
+            # Interaktive CLI: synchron ausgeben, sonst erscheinen Meldungen erst nach dem
+            # folgenden Menü bzw. Eingabe-Prompt
+            self.logger.addHandler(self.console_handler)
+        else:
+            # Dienstbetrieb: Ausgabe über eine Queue entkoppeln, Aufrufer stellen den Record nur ein,
+            # das eigentliche Schreiben übernimmt der Hintergrund-Thread des Listeners
+            self.log_queue = queue.Queue(-1)
+            self.queue_handler = logging.handlers.QueueHandler(self.log_queue)
+            self.listener = logging.handlers.QueueListener(
+                self.log_queue, self.console_handler, respect_handler_level=True)
+            self.listener.start()
+            # Beim Beenden noch anstehende Meldungen ausgeben
+            atexit.register(self.listener.stop)
+            
+            self.logger.addHandler(self.queue_handler)
+        
+        # Zwischengespeicherter Level-Check für Hot-Paths (GPIO-Polling)
+        self.debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Prüft, ob Meldungen des angegebenen Levels ausgegeben werden"""
+        return self.logger.isEnabledFor(level)
     
     def set_level(self, level: Union[str, int, LogLevel]):
         """Log-Level setzen"""
@@ -98,6 +126,7 @@ class Logger:
             
         self.logger.setLevel(level)
         self.console_handler.setLevel(level)
+        self.debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
     
     def debug(self, message: str, category: str = LogCategory.SYSTEM, entity_id: str = None):
         """Debug-Log mit Kategorie"""
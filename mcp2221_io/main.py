@@ -1,16 +1,14 @@
-import mcp2221_io.const as const
-
-import os
-import time
-import yaml
+import signal
+import sys
 
 
 
 import logging
 from termcolor import colored
 from typing import Dict, List, Optional, Any
-from mcp2221_io import get_logger, get_config, MQTTClient, IOController
-from mcp2221_io.const import MCP2221, FT232H, HW, validate_hardware_config
+from mcp2221_io import get_logger, get_config
+from mcp2221_io.new_core import ConfigError
+from mcp2221_io.const import HW, current_hardware
 
 
 def validate_hardware_config(config_value):
@@ -49,13 +47,18 @@ def validate_hardware_config(config_value):
 
 
 
-if __name__ == "__main__":
-    # Konfiguration einlesen
-    current_dir = os.path.dirname(os.path.abspath(__file__))  # mcp2221_io/mcp2221_io/
-    parent_dir = os.path.dirname(current_dir)                # mcp2221_io/
-    config_path = os.path.join(parent_dir, "config.yaml")
+def main():
+    """Einstiegspunkt des Controllers (auch für den setup.py-Entry-Point).
 
-    config = get_config()
+    Returns:
+        int: Exit-Code (0 bei Erfolg, 1 bei fehlerhafter Konfiguration)
+    """
+    # Konfiguration einlesen (Pfad wird in new_core aufgelöst)
+    try:
+        config = get_config()
+    except ConfigError as e:
+        print(colored(f"Fehlerhafte Konfiguration: {e}", "red"), file=sys.stderr)
+        return 1
     logger = get_logger()
 
     # Logger initialisieren
@@ -66,33 +69,45 @@ if __name__ == "__main__":
 
     if not validate_hardware_config(config.get_value("hardware")):
         logger.critical(colored("Die Konfiguration des Punkts 'hardware' ist fehlerhaft. Mögliche Fehler: KEIN Eintrag ODER MEHRERE Einträge sind 'true'.", "red"))
-        exit(1)
+        return 1
 
-    if config.get_value("hardware.mcp2221"):
-        const.HW = const.MCP2221
-        hw_str = "MCP2221"
+    hardware = current_hardware()
+    if hardware.hw is HW.MCP2221:
+        hw_str = hardware.name
         import digitalio
         import board
-    elif config.get_value("hardware.ft232h"):
-        const.HW = const.FT232H
-        hw_str = "FT232H"
+    elif hardware.hw is HW.FT232H:
+        hw_str = hardware.name
     else:
         logger.critical(colored("Kein Hardware-Board konfiguriert!", "red"))
-        exit(1)
+        return 1
 
     logger.info("Hardware festgelegt als " + hw_str)
 
 
-    # MQTT-Client erstellen
-    mqtt_client = MQTTClient(config.get_value('mqtt'), config.get_value('logging.mqtt'))
-    mqtt_client.connect()  # Verbindung herstellen
+    # Hardware- und MQTT-Module erst jetzt laden (nach Prüfung der Konfiguration)
+    from mcp2221_io import IOController
+
+    # MQTT-Client nur erstellen, wenn MQTT konfiguriert ist
+    mqtt_client = None
+    if config.get_value('mqtt'):
+        from mcp2221_io import MQTTClient
+        mqtt_client = MQTTClient(config.get_value('mqtt'), config.get_value('logging.mqtt'))
+        mqtt_client.connect()  # Verbindung herstellen
 
 
 
     # Controller erstellen und starten
     controller = IOController(mqtt_client)
 
+    def _request_stop(signum, frame):
+        # SIGINT (Strg+C) und SIGTERM (systemd/Docker) beenden den Haupt-Loop sofort
+        logger.info("Signal %s empfangen, Programm wird beendet.", signal.Signals(signum).name)
+        controller.stop_event.set()
+
     if controller.start():        
+        signal.signal(signal.SIGINT, _request_stop)
+        signal.signal(signal.SIGTERM, _request_stop)
         try:
             # Haupt-Loop
             i = 0
@@ -101,31 +116,37 @@ if __name__ == "__main__":
                 controller.update()
                 
                 # MQTT-Client aktualisieren
-                mqtt_client.update()
+                if mqtt_client:
+                    mqtt_client.update()
                 
-                # Status-Ausgabe für Debugging
-                for sensor_id, sensor in controller.sensors.items():
+                # Status-Ausgabe für Debugging (Texte nur bauen, wenn DEBUG aktiv ist)
+                if logger.isEnabledFor(logging.DEBUG):
                     if config.get_value("logging.sensors", False):
-                        logger.debug(f"Sensor " + colored(sensor_id, 'blue') + ": " + colored(sensor.state, 'green' if sensor.state else 'red'))
-                for actor_id, actor in controller.actors.items():
+                        for sensor_id, sensor in controller.sensors.items():
+                            logger.debug("Sensor %s: %s", colored(sensor_id, 'blue'), colored(sensor.state, 'green' if sensor.state else 'red'))
                     if config.get_value("logging.actors", False):
-                        logger.debug(f"Aktor " + colored(actor_id, 'magenta') + ": " + colored(actor.state, 'green' if actor.state else 'red'))
+                        for actor_id, actor in controller.actors.items():
+                            logger.debug("Aktor %s: %s", colored(actor_id, 'magenta'), colored(actor.state, 'green' if actor.state else 'red'))
 
                 
                 if i == 10:
                     # controller.get_actor('door_hintertuer').toggle()
                     print("")
 
-                # Kurzes Timeout zum Verschnaufen
+                # Kurzes Timeout zum Verschnaufen; endet sofort, sobald der Controller gestoppt wird
                 i += 1
-                time.sleep(0.1)
-                
-        except KeyboardInterrupt:
-            print("Programm durch Benutzer unterbrochen.")
+                controller.stop_event.wait(0.1)
 
         finally:
             # Controller stoppen
             controller.stop()
 
             # MQTT-Client trennen
-            mqtt_client.disconnect()
\ No newline at end of file
+            if mqtt_client:
+                mqtt_client.disconnect()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
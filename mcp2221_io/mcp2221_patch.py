@@ -3,7 +3,7 @@
 import os
 import hid
 import time
-from typing import Optional
+from typing import Optional, Tuple
 import atexit
 
 class MCP2221Device:
@@ -125,6 +125,123 @@ def patch_blinka():
     if not hasattr(mcp2221_module, 'mcp2221'):
         mcp2221_module.mcp2221 = PatchedMCP2221()
 
+# HID-Kommandos und Offsets laut MCP2221-Datenblatt
+CMD_STATUS_SET_PARAMETERS = 0x10
+CMD_GET_GPIO_VALUES = 0x51
+GPIO_NOT_CONFIGURED = 0xEE    # Antwortwert für Pins, die nicht als GPIO konfiguriert sind
+CMD_SET_SRAM_SETTINGS = 0x60
+STATUS_IOC_FLAG_OFFSET = 24   # Byte 24 der Status-Antwort: Interrupt-Flankenerkennung
+SRAM_ALTER_INTERRUPT = 0x80
+SRAM_ALTER_POSITIVE_EDGE = 0x10
+SRAM_ENABLE_POSITIVE_EDGE = 0x08
+SRAM_ALTER_NEGATIVE_EDGE = 0x04
+SRAM_ENABLE_NEGATIVE_EDGE = 0x02
+SRAM_CLEAR_INTERRUPT_FLAG = 0x01
+IOC_PIN = 1                   # Interrupt-on-Change ist nur auf GP1 verfügbar
+G2_MASK = 1 << 2
+G3_MASK = 1 << 3
+
+def _blinka_mcp2221():
+    """Gibt die von Blinka verwendete MCP2221-Instanz zurück"""
+    from adafruit_blinka.microcontroller.mcp2221.mcp2221 import mcp2221
+    return mcp2221
+
+def enable_gp1_interrupt(rising: bool = True, falling: bool = True):
+    """
+    Schaltet GP1 auf Interrupt-Erkennung und aktiviert die gewünschten Flanken.
+    Der Pin ist danach nicht mehr als GPIO lesbar.
+
+    :param rising: Steigende Flanken erkennen
+    :param falling: Fallende Flanken erkennen
+    """
+    mcp = _blinka_mcp2221()
+    mcp.gp_set_mode(IOC_PIN, mcp.GP_ALT2)
+
+    settings = SRAM_ALTER_INTERRUPT | SRAM_ALTER_POSITIVE_EDGE | SRAM_ALTER_NEGATIVE_EDGE | SRAM_CLEAR_INTERRUPT_FLAG
+    if rising:
+        settings |= SRAM_ENABLE_POSITIVE_EDGE
+    if falling:
+        settings |= SRAM_ENABLE_NEGATIVE_EDGE
+
+    report = bytearray(12)
+    report[0] = CMD_SET_SRAM_SETTINGS
+    report[6] = settings
+    mcp._hid_xfer(bytes(report))
+
+def disable_gp1_interrupt():
+    """Deaktiviert die Interrupt-Erkennung und schaltet GP1 zurück auf GPIO-Eingang"""
+    mcp = _blinka_mcp2221()
+    report = bytearray(12)
+    report[0] = CMD_SET_SRAM_SETTINGS
+    report[6] = SRAM_ALTER_INTERRUPT | SRAM_ALTER_POSITIVE_EDGE | SRAM_ALTER_NEGATIVE_EDGE | SRAM_CLEAR_INTERRUPT_FLAG
+    mcp._hid_xfer(bytes(report))
+    mcp.gp_set_mode(IOC_PIN, mcp.GP_GPIO)
+    mcp.gpio_set_direction(IOC_PIN, 1)
+
+def read_all_gpio() -> Tuple[Optional[bool], ...]:
+    """
+    Liest die Pegel aller vier GPIOs mit einer einzigen HID-Transaktion (GET GPIO VALUES)
+
+    :return: Tuple mit den Pegeln von GP0..GP3 (None für Pins ohne GPIO-Funktion)
+    """
+    resp = _blinka_mcp2221()._hid_xfer(bytes([CMD_GET_GPIO_VALUES]))
+    return tuple(
+        None if resp[2 + 2 * pin] == GPIO_NOT_CONFIGURED else bool(resp[2 + 2 * pin])
+        for pin in range(4)
+    )
+
+def read_ioc_pin_level() -> bool:
+    """
+    Liest den tatsächlichen Pegel von GP1, auch während die Interrupt-Erkennung aktiv ist.
+    Im IOC-Modus meldet GET GPIO VALUES für GP1 GPIO_NOT_CONFIGURED; der Pin wird dann kurz
+    als GPIO-Eingang gelesen und anschließend wieder auf Interrupt-Erkennung geschaltet
+    (die Flankenauswahl in den SRAM-Einstellungen bleibt dabei erhalten).
+
+    :return: Pegel von GP1
+    """
+    level = read_all_gpio()[IOC_PIN]
+    if level is not None:
+        return level
+    mcp = _blinka_mcp2221()
+    mcp.gp_set_mode(IOC_PIN, mcp.GP_GPIO)
+    mcp.gpio_set_direction(IOC_PIN, 1)
+    try:
+        return bool(read_all_gpio()[IOC_PIN])
+    finally:
+        mcp.gp_set_mode(IOC_PIN, mcp.GP_ALT2)
+
+def read_gpio_pair(mcp=None, mask: int = G2_MASK | G3_MASK) -> Tuple[bool, bool]:
+    """
+    Liest zwei GPIOs (Standard: GP2 und GP3) mit einer einzigen HID-Transaktion (GET GPIO VALUES)
+
+    :param mcp: MCP2221-Instanz (Standard: die von Blinka verwendete)
+    :param mask: Bitmaske mit genau zwei Pins aus GP0..GP3
+    :return: Tuple (Pegel des niedrigeren Pins, Pegel des höheren Pins)
+    """
+    if mcp is None:
+        mcp = _blinka_mcp2221()
+    resp = mcp._hid_xfer(bytes([CMD_GET_GPIO_VALUES]))
+    low, high = (pin for pin in range(4) if mask & (1 << pin))
+    # Nicht als GPIO konfigurierte Pins (GPIO_NOT_CONFIGURED) gelten als False
+    return resp[2 + 2 * low] == 1, resp[2 + 2 * high] == 1
+
+def read_and_clear_interrupt_flag() -> bool:
+    """
+    Liest das Interrupt-Flag von GP1 mit einer einzigen Status-Abfrage und setzt es bei Bedarf zurück
+
+    :return: True, wenn seit der letzten Abfrage eine Flanke erkannt wurde
+    """
+    mcp = _blinka_mcp2221()
+    status = mcp._hid_xfer(bytes([CMD_STATUS_SET_PARAMETERS, 0x00, 0x00, 0x00, 0x00]))
+    if not status[STATUS_IOC_FLAG_OFFSET]:
+        return False
+
+    report = bytearray(12)
+    report[0] = CMD_SET_SRAM_SETTINGS
+    report[6] = SRAM_ALTER_INTERRUPT | SRAM_CLEAR_INTERRUPT_FLAG
+    mcp._hid_xfer(bytes(report))
+    return True
+
 # Test-Code
 if __name__ == "__main__":
     try:
@@ -2,6 +2,7 @@
 # Version: 1.8.0
 
 import json
+import sys
 from typing import Dict, Optional, Callable
 import paho.mqtt.client as mqtt
 import threading
@@ -16,6 +17,7 @@ from .discovery import MQTTDiscoveryMixin
 from .publishing import MQTTPublishingMixin
 from .states import MQTTStatesMixin
 from .connection import MQTTConnectionMixin
+from .batcher import PublishBatcher
 
 # Direkter Print ohne Logger (für Boot-Nachrichten)
 def direct_print(message):
@@ -29,6 +31,11 @@ class MQTTHandler(MQTTDebugMixin, MQTTBaseMixin, MQTTCallbacksMixin, MQTTDiscove
         """Initialisiert den MQTT Handler"""
         self.config = config
         
+        # entity_type einmalig klein geschrieben und interniert ablegen (statt .lower() bei jedem Zugriff)
+        for section, default_type in (('actors', 'switch'), ('sensors', 'binary_sensor')):
+            for entity_config in config.get(section, {}).values():
+                entity_config['entity_type'] = sys.intern(entity_config.get('entity_type', default_type).lower())
+        
         # Debug-Konfiguration initialisieren
         if debug_config is None:
             debug_config = {}
@@ -39,9 +46,11 @@ class MQTTHandler(MQTTDebugMixin, MQTTBaseMixin, MQTTCallbacksMixin, MQTTDiscove
         # MQTT-Client initialisieren
         self.mqtt_client = mqtt.Client()
         self.connected = threading.Event()
+        self.is_connected = False  # Einfache Kopie von connected für häufige Abfragen (nur lesen)
         self.restored_states: Dict[str, bool] = {}
         self.restore_complete = threading.Event()
         self._shutdown_flag = threading.Event()
+        self.publish_batcher = PublishBatcher(self.mqtt_client)  # Bündelt State-Publishes
         
         # Board Status
         self._board_status = False
@@ -0,0 +1,67 @@
+# mqtt_handler/batcher.py
+# Version: 1.0.0
+
+import threading
+from collections import deque
+import paho.mqtt.client as mqtt
+from ..logging_config import logger
+
+class PublishBatcher:
+    """Sammelt State-Publishes und sendet sie gebündelt aus einem Flusher-Thread"""
+    
+    def __init__(self, client, flush_interval: float = 0.005):
+        """
+        :param client: paho MQTT-Client, über den veröffentlicht wird
+        :param flush_interval: Sammelzeit in Sekunden nach dem ersten gepufferten Publish
+        """
+        self._client = client
+        self._flush_interval = flush_interval
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._pending = threading.Event()  # Gesetzt, sobald etwas im Puffer liegt
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="MQTTPublishBatcher", daemon=True)
+        self._thread.start()
+
+    def publish(self, topic: str, payload: str, qos: int = 1, retain: bool = True, immediate: bool = False):
+        """Puffert einen Publish; immediate=True umgeht den Puffer (z.B. für Status/LWT)"""
+        if immediate:
+            return self._client.publish(topic, payload, qos=qos, retain=retain)
+        with self._lock:
+            self._queue.append((topic, payload, qos, retain))
+        self._pending.set()
+
+    def flush(self) -> list:
+        """Sendet alle gepufferten Publishes in einem Durchlauf und gibt deren MQTTMessageInfo zurück"""
+        with self._lock:
+            batch = tuple(self._queue)
+            self._queue.clear()
+        
+        publish = self._client.publish
+        infos = []
+        for topic, payload, qos, retain in batch:
+            try:
+                result = publish(topic, payload, qos=qos, retain=retain)
+                if result.rc != mqtt.MQTT_ERR_SUCCESS:
+                    logger.error(f"[MQTT] Fehler beim Publizieren auf {topic}: {result.rc}")
+                else:
+                    infos.append(result)
+            except Exception as e:
+                logger.error(f"[MQTT] Fehler beim Publizieren auf {topic}: {e}")
+        return infos
+
+    def stop(self) -> list:
+        """Beendet den Flusher-Thread, sendet den restlichen Puffer und gibt dessen MQTTMessageInfo zurück"""
+        self._stop.set()
+        self._pending.set()
+        self._thread.join(timeout=1.0)
+        return self.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._pending.wait()
+            # Kurz sammeln, damit schnell aufeinanderfolgende Änderungen gemeinsam rausgehen
+            if self._stop.wait(self._flush_interval):
+                break
+            self._pending.clear()
+            self.flush()
\ No newline at end of file
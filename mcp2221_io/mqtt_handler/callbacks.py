@@ -12,6 +12,7 @@ class MQTTCallbacksMixin:
         """Callback für erfolgreiche MQTT-Verbindung"""
         if rc == 0:
             self.debug_process_msg("MQTT Verbindung erfolgreich")
+            self.is_connected = True
             self.connected.set()
             
             self._restore_states()
@@ -72,6 +73,7 @@ class MQTTCallbacksMixin:
         else:
             self.debug_process_msg(f"MQTT Verbindung unerwartet getrennt mit Code {rc}")
             
+        self.is_connected = False
         self.connected.clear()
         
         # Versuche Debug-Nachricht zu veröffentlichen, wenn Methode existiert
@@ -71,6 +71,19 @@ class MQTTConnectionMixin:
             
             raise
     
+    def _wait_for_publishes(self, infos, timeout: float):
+        """Wartet bis zu timeout Sekunden (insgesamt) auf die Zustellung der übergebenen Nachrichten"""
+        deadline = time.monotonic() + timeout
+        for info in infos:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                info.wait_for_publish(timeout=remaining)
+            except (RuntimeError, ValueError):
+                # Nachricht wurde nicht in die Warteschlange aufgenommen
+                continue
+    
     def disconnect(self):
         """Trennt die Verbindung zum MQTT Broker"""
         self.debug_process_msg("Trenne MQTT-Verbindung")
@@ -79,27 +92,30 @@ class MQTTConnectionMixin:
         if hasattr(self, '_board_status_timer') and self._board_status_timer and self._board_status_timer.is_alive():
             self._board_status_timer.join(timeout=1.0)
         
+        # Noch gepufferte State-Publishes vor dem Offline-Status senden
+        pending = self.publish_batcher.stop()
+        
         if self.connected.is_set():
             # Status auf offline setzen
             try:
-                self.mqtt_client.publish(
+                pending.append(self.mqtt_client.publish(
                     f"{self.base_topic}/status",
                     "offline",
                     qos=1,
                     retain=True
-                )
+                ))
                 self.debug_send_msg(f"{self.base_topic}/status", "offline", retained=True, qos=1)
                 
                 # Offline-Status für Board
-                self.mqtt_client.publish(
+                pending.append(self.mqtt_client.publish(
                     f"{self.base_topic}/board_status/state",
                     "offline",
                     qos=1,
                     retain=True
-                )
+                ))
                 
-                # Warte kurz, damit die Nachricht gesendet werden kann
-                time.sleep(self.config.get('timeouts', {}).get('disconnect', 0.5))
+                # Gemeinsam auf die Zustellung aller Nachrichten warten (statt pauschal zu schlafen)
+                self._wait_for_publishes(pending, self.config.get('timeouts', {}).get('disconnect', 0.5))
             except Exception as e:
                 self.debug_error(f"Fehler beim Setzen des Offline-Status: {e}", e)
             
@@ -118,6 +134,7 @@ class MQTTConnectionMixin:
                 
                 # Falls immer noch verbunden, manuell den Status zurücksetzen
                 if self.connected.is_set():
+                    self.is_connected = False
                     self.connected.clear()
                     self.debug_process_msg("Verbindung manuell getrennt nach Timeout")
                 
@@ -132,4 +149,5 @@ class MQTTConnectionMixin:
                     pass
                 
                 # Stellen wir sicher, dass der Status zurückgesetzt ist
+                self.is_connected = False
                 self.connected.clear()
\ No newline at end of file
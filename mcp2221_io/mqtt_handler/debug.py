@@ -36,32 +36,33 @@ class MQTTDebugMixin:
 
     def debug_send_msg(self, topic, payload, retained=False, qos=0):
         """Debug-Ausgabe für gesendete MQTT-Nachrichten"""
-        if hasattr(self, 'debug_send') and self.debug_send:
-            # Verbesserte Ausgabe mit mehr Details
-            retain_flag = "RETAINED" if retained else ""
-            qos_info = f"QoS={qos}" if qos > 0 else ""
-            
-            # Format: [MQTT SEND] Topic=topic Payload=payload [RETAINED] [QoS=1]
-            details = []
-            if retain_flag:
-                details.append(retain_flag)
-            if qos_info:
-                details.append(qos_info)
-            
-            details_str = f" [{' '.join(details)}]" if details else ""
-            
-            # Füge MQTT Message-Typ dem Topic hinzu (basierend auf Topic-Pattern)
-            topic_parts = topic.split('/')
-            msg_type = ""
-            if len(topic_parts) >= 3:
-                if topic_parts[-1] == "set":
-                    msg_type = " [COMMAND]"
-                elif topic_parts[-1] == "state":
-                    msg_type = " [STATE]"
-                elif "discovery" in topic or "config" in topic:
-                    msg_type = " [DISCOVERY]"
-                    
-            logger.debug(f"[MQTT SEND] Topic={topic}{msg_type} Payload={payload}{details_str}")
+        if not getattr(self, 'debug_send', False):
+            return
+        # Verbesserte Ausgabe mit mehr Details
+        retain_flag = "RETAINED" if retained else ""
+        qos_info = f"QoS={qos}" if qos > 0 else ""
+        
+        # Format: [MQTT SEND] Topic=topic Payload=payload [RETAINED] [QoS=1]
+        details = []
+        if retain_flag:
+            details.append(retain_flag)
+        if qos_info:
+            details.append(qos_info)
+        
+        details_str = f" [{' '.join(details)}]" if details else ""
+        
+        # Füge MQTT Message-Typ dem Topic hinzu (basierend auf Topic-Pattern)
+        topic_parts = topic.split('/')
+        msg_type = ""
+        if len(topic_parts) >= 3:
+            if topic_parts[-1] == "set":
+                msg_type = " [COMMAND]"
+            elif topic_parts[-1] == "state":
+                msg_type = " [STATE]"
+            elif "discovery" in topic or "config" in topic:
+                msg_type = " [DISCOVERY]"
+                
+        logger.debug(f"[MQTT SEND] Topic={topic}{msg_type} Payload={payload}{details_str}")
 
     def debug_receive_msg(self, topic, payload):
         """Debug-Ausgabe für empfangene MQTT-Nachrichten"""
@@ -61,16 +61,17 @@ class MQTTDiscoveryMixin:
                 }]
             }
             
-            self.mqtt_client.publish(config_topic, json.dumps(payload), qos=1, retain=True)
+            payload_json = json.dumps(payload)  # Einmal serialisieren für Publish und Debug-Ausgabe
+            self.mqtt_client.publish(config_topic, payload_json, qos=1, retain=True)
             self.debug_process_msg("Board Discovery-Konfiguration veröffentlicht")
-            self.debug_send_msg(config_topic, json.dumps(payload), qos=1, retained=True)
+            self.debug_send_msg(config_topic, payload_json, qos=1, retained=True)
         except Exception as e:
             self.debug_error(f"Fehler bei Board-Discovery: {e}", e)
 
     def _publish_actor_discovery(self, actor_id: str, actor_config: Dict):
         """Veröffentlicht die Discovery-Konfiguration für einen Actor"""
         try:
-            entity_type = actor_config.get('entity_type', 'switch').lower()
+            entity_type = actor_config.get('entity_type', 'switch')
             discovery_type = EntityTypeConfig.get_discovery_type(entity_type)
             discovery_config = EntityTypeConfig.get_discovery_config(entity_type)
             
@@ -124,21 +125,22 @@ class MQTTDiscoveryMixin:
             self.debug_process_msg(f"Discovery-Konfiguration für {actor_id} ({entity_type})")
             
             # Veröffentlichen der Konfiguration
+            payload_json = json.dumps(payload)  # Einmal serialisieren für Publish und Debug-Ausgabe
             self.mqtt_client.publish(
                 config_topic,
-                json.dumps(payload),
+                payload_json,
                 qos=1,
                 retain=True  # Retain auf True setzen für permanente Verfügbarkeit
             )
             self.debug_process_msg(f"Discovery-Konfiguration für Actor {actor_id} veröffentlicht")
-            self.debug_send_msg(config_topic, json.dumps(payload), qos=1, retained=True)
+            self.debug_send_msg(config_topic, payload_json, qos=1, retained=True)
         except Exception as e:
             self.debug_error(f"Fehler bei Actor-Discovery {actor_id}: {e}", e)
         
     def _publish_sensor_discovery(self, sensor_id: str, sensor_config: Dict):
         """Veröffentlicht die Discovery-Konfiguration für einen Sensor"""
         try:
-            entity_type = sensor_config.get('entity_type', 'binary_sensor').lower()
+            entity_type = sensor_config.get('entity_type', 'binary_sensor')
             discovery_type = EntityTypeConfig.get_discovery_type(entity_type)
             discovery_config = EntityTypeConfig.get_discovery_config(entity_type)
             
@@ -181,13 +183,14 @@ class MQTTDiscoveryMixin:
             if 'device_class' in sensor_config:
                 payload["device_class"] = sensor_config['device_class']
                 
+            payload_json = json.dumps(payload)  # Einmal serialisieren für Publish und Debug-Ausgabe
             self.mqtt_client.publish(
                 config_topic,
-                json.dumps(payload),
+                payload_json,
                 qos=1,
                 retain=True  # Retain auf True setzen für permanente Verfügbarkeit
             )
             self.debug_process_msg(f"Discovery-Konfiguration für Sensor {sensor_id} veröffentlicht")
-            self.debug_send_msg(config_topic, json.dumps(payload), qos=1, retained=True)
+            self.debug_send_msg(config_topic, payload_json, qos=1, retained=True)
         except Exception as e:
             self.debug_error(f"Fehler bei Sensor-Discovery {sensor_id}: {e}", e)
\ No newline at end of file
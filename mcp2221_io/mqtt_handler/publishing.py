@@ -27,14 +27,8 @@ class MQTTPublishingMixin:
             topic = f"{self.base_topic}/{actor_id}/state"
             self.debug_process_msg(f"Publiziere State {state_str} für {actor_id}")
             
-            result = self.mqtt_client.publish(topic, state_str, qos=1, retain=True)
+            self.publish_batcher.publish(topic, state_str)
             self.debug_send_msg(topic, state_str, retained=True, qos=1)
-            
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                self.debug_process_msg(f"State für {actor_id} erfolgreich publiziert")
-            else:
-                msg = f"Fehler beim Publizieren des States für {actor_id}: {result.rc}"
-                self.debug_error(msg)
         except Exception as e:
             error_msg = f"Fehler beim Publizieren des States: {e}"
             self.debug_error(error_msg, e)
@@ -60,7 +54,7 @@ class MQTTPublishingMixin:
             actor_config = self.config['actors'][cover_id]
             entity_type = actor_config.get('entity_type', 'switch')
             
-            if entity_type.lower() != 'cover':
+            if entity_type != 'cover':
                 msg = f"{cover_id} ist kein Cover (Typ: {entity_type})"
                 self.debug_error(msg)
                 return
@@ -69,17 +63,9 @@ class MQTTPublishingMixin:
             self.debug_process_msg(f"Publiziere Cover-State {state} für {cover_id}")
             logger.info(f"[MQTT] Publiziere Cover-State: {cover_id} -> {state}")
             
-            # Nachricht veröffentlichen
-            result = self.mqtt_client.publish(topic, state, qos=1, retain=True)
+            # Nachricht gebündelt veröffentlichen
+            self.publish_batcher.publish(topic, state)
             self.debug_send_msg(topic, state, retained=True, qos=1)
-            
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                self.debug_process_msg(f"Cover-State für {cover_id} erfolgreich publiziert")
-                logger.info(f"[MQTT] Cover-State für {cover_id} erfolgreich publiziert")
-            else:
-                msg = f"Fehler beim Publizieren des Cover-States für {cover_id}: {result.rc}"
-                self.debug_error(msg)
-                logger.error(f"[MQTT] {msg}")
         except Exception as e:
             error_msg = f"Fehler beim Publizieren des Cover-States: {e}"
             self.debug_error(error_msg, e)
@@ -115,15 +101,9 @@ class MQTTPublishingMixin:
             topic = f"{self.base_topic}/{sensor_id}/state"
             self.debug_process_msg(f"Publiziere Sensor-State {state_str} für {sensor_id}")
             
-            # Nachricht veröffentlichen
-            result = self.mqtt_client.publish(topic, state_str, qos=1, retain=True)
+            # Nachricht gebündelt veröffentlichen
+            self.publish_batcher.publish(topic, state_str)
             self.debug_send_msg(topic, state_str, retained=True, qos=1)
-            
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                self.debug_process_msg(f"Sensor-State für {sensor_id} erfolgreich publiziert")
-            else:
-                msg = f"Fehler beim Publizieren des Sensor-States für {sensor_id}: {result.rc}"
-                self.debug_error(msg)
         except Exception as e:
             error_msg = f"Fehler beim Publizieren des Sensor-States: {e}"
             self.debug_error(error_msg, e)
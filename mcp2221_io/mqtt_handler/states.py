@@ -112,7 +112,7 @@ class MQTTStatesMixin:
             if force_republish:
                 # Actors
                 for actor_id, actor_config in self.config['actors'].items():
-                    entity_type = actor_config.get('entity_type', 'switch').lower()
+                    entity_type = actor_config.get('entity_type', 'switch')
                     discovery_config = EntityTypeConfig.get_discovery_config(entity_type)
                     
                     # Status-Topic für alle Entities
@@ -262,7 +262,7 @@ class MQTTStatesMixin:
                     startup_state = actor_config.get('startup_state', 'OFF')
                     
                     # Spezialbehandlung für Cover
-                    if entity_type.lower() == 'cover':
+                    if entity_type == 'cover':
                         # Für Cover speichern wir den Startup-State als String
                         self.restored_states[actor_id] = startup_state
                     else:
@@ -293,7 +293,7 @@ class MQTTStatesMixin:
         entity_type = actor_config.get('entity_type', 'switch')
         
         # Spezialbehandlung für Cover
-        if entity_type.lower() == 'cover':
+        if entity_type == 'cover':
             # Für Cover wird der Zustand durch die Sensoren bestimmt,
             # daher ist kein initialer State erforderlich
             return False
@@ -1,32 +1,136 @@
+import functools
 import os
 import yaml
 import logging
 from typing import Any
 
+# LibYAML-Parser verwenden, sofern PyYAML damit gebaut wurde (deutlich schneller als der Python-Parser)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
+class ConfigError(ValueError):
+    """Die Konfiguration verletzt das Schema (wird beim Laden nicht abgefangen)."""
 
-# Singleton-Instanzen
-config = None
-logger = None
+# Schema der Entitäten; 'default' (sofern vorhanden) wird beim Laden in die Konfiguration übernommen
+_ACTOR_SCHEMA = {
+    "type": "object",
+    "required": ["pin"],
+    "properties": {
+        "entity_type": {"type": "string", "enum": ["switch", "button", "lock", "cover"], "default": "switch"},
+        "inverted": {"type": "boolean", "default": False},
+        "auto_reset": {"type": "boolean", "default": False},
+        "reset_delay": {"type": "number", "minimum": 0, "default": 0.0},
+        "device_class": {"type": "string"},
+    },
+}
+_SENSOR_SCHEMA = {
+    "type": "object",
+    "required": ["pin"],
+    "properties": {
+        "entity_type": {"type": "string", "default": "binary_sensor"},
+        "inverted": {"type": "boolean", "default": False},
+        "device_class": {"type": "string"},
+        "poll_budget": {"type": "integer", "minimum": 1},
+    },
+}
+_SCHEMA_TYPES = {"string": str, "boolean": bool, "number": (int, float), "integer": int}
+
+def _validate_schema(data: dict) -> dict:
+    """Prüft 'actors' und 'sensors' gegen das Schema und ergänzt die Standardwerte.
+    
+    :raises ConfigError: bei fehlenden Pflichtfeldern, falschen Typen oder ungültigen Werten
+    """
+    for section, schema in (("actors", _ACTOR_SCHEMA), ("sensors", _SENSOR_SCHEMA)):
+        entities = data.get(section)
+        if entities is None:
+            continue
+        if not isinstance(entities, dict):
+            raise ConfigError(f"'{section}' muss eine Zuordnung ID -> Konfiguration sein")
+        for entity_id, entity_config in entities.items():
+            where = f"{section}.{entity_id}"
+            if not isinstance(entity_config, dict):
+                raise ConfigError(f"{where}: Eintrag muss eine Zuordnung sein")
+            for key in schema["required"]:
+                if key not in entity_config:
+                    raise ConfigError(f"{where}: Pflichtfeld '{key}' fehlt")
+            for key, prop in schema["properties"].items():
+                if key not in entity_config:
+                    if "default" in prop:
+                        entity_config[key] = prop["default"]
+                    continue
+                value = entity_config[key]
+                # bool ist eine Unterklasse von int und zählt nicht als Zahl
+                if (not isinstance(value, _SCHEMA_TYPES[prop["type"]])
+                        or (prop["type"] in ("number", "integer") and isinstance(value, bool))):
+                    raise ConfigError(f"{where}.{key}: erwartet {prop['type']}, erhalten {value!r}")
+                if "enum" in prop and value not in prop["enum"]:
+                    raise ConfigError(f"{where}.{key}: ungültiger Wert {value!r} (erlaubt: {', '.join(prop['enum'])})")
+                if "minimum" in prop and value < prop["minimum"]:
+                    raise ConfigError(f"{where}.{key}: Wert {value!r} ist kleiner als {prop['minimum']}")
+    return data
+
+def normalize_config(data: dict) -> dict:
+    """Validiert die Konfiguration einmalig beim Laden und ergänzt die Standardwerte.
+    
+    Danach sind in jedem Aktor/Sensor alle Schema-Felder mit Standardwert vorhanden,
+    'entity_type' ist kleingeschrieben; nachgelagerter Code kann diese direkt indizieren.
+    
+    :raises ConfigError: wenn die Konfiguration das Schema verletzt
+    """
+    if data is None:  # Leere YAML-Datei
+        return {}
+    if not isinstance(data, dict):
+        raise ConfigError("Die Konfiguration muss auf oberster Ebene eine Zuordnung sein")
+    for section in ("actors", "sensors"):
+        for entity_config in (data.get(section) or {}).values():
+            if isinstance(entity_config, dict) and isinstance(entity_config.get('entity_type'), str):
+                entity_config['entity_type'] = entity_config['entity_type'].lower()
+    return _validate_schema(data)
+
+
+
+# Singleton-Instanzen (Zugriff über get_config()/get_logger() oder new_core.config/new_core.logger)
+_config = None
+_logger = None
+
+# Pfad zur Konfigurationsdatei einmalig beim Import auflösen
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))  # /usr/local/bin/mcp2221_io/
+_CONFIG_PATH = os.path.normpath(os.path.join(_MODULE_DIR, "..", "config.yaml"))  # Ein Verzeichnis nach oben
+
+@functools.lru_cache(maxsize=4)
+def load_config(config_path: str = _CONFIG_PATH) -> "Config":
+    """Lädt eine Konfiguration einmalig je Pfad und gibt bei weiteren Aufrufen dieselbe Instanz zurück.
+    
+    Relative Pfade werden auf das Paketverzeichnis bezogen.
+    """
+    return Config(os.path.join(_MODULE_DIR, config_path))
 
 def get_config():
     """Gibt die globale Config-Instanz zurück oder erstellt sie, wenn sie nicht existiert."""
-    global config
-    if config is None:
-        # Korrigierter Konfigurationspfad
-        current_dir = os.path.dirname(os.path.abspath(__file__))  # /usr/local/bin/mcp2221_io/
-        config_path = os.path.join(current_dir, "..", "config.yaml")  # Ein Verzeichnis nach oben
-        config = Config(config_path)
-    return config
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
 
 def get_logger():
     """Gibt die globale Logger-Instanz zurück oder erstellt sie, wenn sie nicht existiert."""
-    global logger
-    if logger is None:
+    global _logger
+    if _logger is None:
         # Standard-Logging-Level aus Config
-        debug_level = config.get_value("logging.level", "WARNING")
-        logger = Logger(debug_level).get_logger()
-    return logger
+        debug_level = get_config().get_value("logging.level", "WARNING")
+        _logger = Logger(debug_level).get_logger()
+    return _logger
+
+def __getattr__(name):
+    # config/logger erst beim ersten Zugriff laden: ein Import scheitert so nicht an einer
+    # ungültigen Konfiguration, der ConfigError tritt erst beim Aufrufer (z.B. main()) auf
+    if name == "config":
+        return get_config()
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Config:
     def __init__(self, config_path: str = "config.yaml"):
@@ -37,10 +141,14 @@ class Config:
     def load_config(self) -> bool:
         """Lädt die Konfiguration aus der YAML-Datei."""
         try:
-            with open(self.config_path, 'r') as file:
-                self.config = yaml.safe_load(file)
+            # Binär lesen: LibYAML verarbeitet die Bytes direkt ohne Umweg über str
+            with open(self.config_path, 'rb') as file:
+                self.config = normalize_config(yaml.load(file, Loader=YamlLoader))
             print(f"Konfiguration aus {self.config_path} erfolgreich geladen.")
             return True
+        except ConfigError as e:
+            # Schema-Verletzungen nicht mit leerer Konfiguration überspielen
+            raise ConfigError(f"Ungültige Konfiguration in {self.config_path}: {e}") from None
         except Exception as e:
             print(f"Fehler beim Laden der Konfiguration: {e}")
             return False
@@ -83,7 +191,6 @@ class Config:
     def items(self):
         """Gibt die Schlüssel-Wert-Paare der Konfiguration zurück"""
         return self.config.items()
-config = get_config()
 
 class Logger:
     def __init__(self, level: str = "WARNING"):
@@ -112,5 +219,4 @@ class Logger:
         self.logger.info("Logging initialisiert und konfiguriert.")
         
     def get_logger(self):
-        return self.logger
-logger = get_logger()
\ No newline at end of file
+        return self.logger
\ No newline at end of file
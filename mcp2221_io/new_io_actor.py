@@ -1,5 +1,6 @@
 import mcp2221_io.const as const
 
+import logging
 import time
 from termcolor import colored
 # import digitalio
@@ -8,10 +9,11 @@ from mcp2221_io.new_core import get_logger
 from mcp2221_io.new_io_device import IODevice
 
 # Hardware-spezifische Importe
-if const.HW == const.MCP2221:
+_HW = const.current_hardware().hw
+if _HW is const.HW.MCP2221:
     import digitalio
     import board
-elif const.HW == const.FT232H:
+elif _HW is const.HW.FT232H:
     # Hier könnten FT232H-spezifische Importe erfolgen
     # z.B. import adafruit_blinka
     pass
@@ -38,19 +40,23 @@ class IOActor(IODevice):
         else:
             return False
 
-        logger.debug("Aktor " + colored(self.name, 'magenta') +" wurde konfiguriert als OUTPUT")
-        logger.debug("Pin-Status vor 'sync_state():'")
-        logger.debug(f"     Raw-State: {self.state_raw}")
-        logger.debug(f"     State: {self.state}")
-        logger.debug(f"     Last-State: {self._last_state}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Aktor %s wurde konfiguriert als OUTPUT", colored(self.name, 'magenta'))
+            logger.debug("Pin-Status vor 'sync_state():'")
+            logger.debug("     Raw-State: %s", self.state_raw)
+            logger.debug("     State: %s", self.state)
+            logger.debug("     Last-State: %s", self._last_state)
         self.sync_state()
-        logger.debug("Pin-Status nach 'sync_state():'")
-        logger.debug(f"     Raw-State: {self.state_raw}")
-        logger.debug(f"     State: {self.state}")
-        logger.debug(f"     Last-State: {self._last_state}")
+        if debug:
+            logger.debug("Pin-Status nach 'sync_state():'")
+            logger.debug("     Raw-State: %s", self.state_raw)
+            logger.debug("     State: %s", self.state)
+            logger.debug("     Last-State: %s", self._last_state)
 
     def set_auto_reset(self, seconds: float):
-        logger.debug("Auto-Reset für Aktor " + colored(self.name, 'magenta') + f" auf '{seconds}' Sekunden gesetzt.") 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Auto-Reset für Aktor %s auf '%s' Sekunden gesetzt.", colored(self.name, 'magenta'), seconds)
         self._auto_reset = seconds
 
     def set_state(self, new_state: bool) -> None:
@@ -58,7 +64,8 @@ class IOActor(IODevice):
         if self._hw == const.MCP2221:
             if self._digital_pin:                
                 self._digital_pin.value = new_state
-                logger.debug("Status (logisch) für Aktor " + colored(self.name, 'magenta') + f" auf '{not new_state}' gesetzt.")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Status (logisch) für Aktor %s auf '%s' gesetzt.", colored(self.name, 'magenta'), not new_state)
 
 
     def shutdown(self) -> bool:
@@ -88,7 +95,9 @@ class IOActor(IODevice):
         """Muss regelmäßig aufgerufen werden, um den Toggle-Status zu aktualisieren"""
         if self._toggle_active and time.monotonic() - self._toggle_start_time >= self._auto_reset:
             self.turn_off()
-            logger.debug("Auto-Reset für Aktor " + colored(self.name, 'magenta') + f" ausgelöst, Aktor zurückgesetzt (neuer Status (logisch): '{self.state}').") 
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Auto-Reset für Aktor %s ausgelöst, Aktor zurückgesetzt (neuer Status (logisch): '%s').",
+                             colored(self.name, 'magenta'), self.state)
             self._toggle_active = False
     
     @property
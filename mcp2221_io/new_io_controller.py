@@ -2,8 +2,8 @@
 import mcp2221_io.const as const
 
 import os
+import threading
 import time
-import yaml
 # import digitalio
 # import board
 import logging
@@ -16,10 +16,11 @@ from mcp2221_io.new_io_device import IODevice
 from mcp2221_io.new_core import logger, config
 
 # Hardware-spezifische Importe
-if const.HW == const.MCP2221:
+_HW = const.current_hardware().hw
+if _HW is const.HW.MCP2221:
     import digitalio
     import board
-elif const.HW == const.FT232H:
+elif _HW is const.HW.FT232H:
     # Hier könnten FT232H-spezifische Importe erfolgen
     # z.B. import adafruit_blinka
     pass
@@ -33,8 +34,14 @@ class IOController:
         logger.info("IOController wird initialisiert.")
         self.actors = {}  # Speichert alle Aktoren nach Namen
         self.sensors = {}  # Speichert alle Sensoren nach Namen
-        self.running = False      
+        # Gesetzt, solange der Controller nicht läuft; die Hauptschleife wartet darauf statt zu pollen
+        self.stop_event = threading.Event()
+        self.stop_event.set()
         self.mqtt_client = mqtt_client  # MQTT-Client Referenz speichern
+        
+        # Fabrikfunktionen je entity_type (nicht aufgeführte Typen werden übersprungen)
+        self._sensor_factories = {'binary_sensor': self._create_binary_sensor}
+        self._actor_factories = {'switch': self._create_switch}
 
         if self.mqtt_client:
             self.mqtt_client.client.on_message = self.mqtt_client._on_message
@@ -49,10 +56,13 @@ class IOController:
             # Sensoren erstellen
             if 'sensors' in config:
                 for sensor_id, sensor_config in config['sensors'].items():
-                    if sensor_config.get('entity_type') == 'binary_sensor':
-                        logger.debug("Entität " + colored(sensor_id, "blue") + f" ist ein Sensor vom Typ '{sensor_config.get('entity_type')}'")
+                    entity_type = sensor_config['entity_type']
+                    create_sensor = self._sensor_factories.get(entity_type)
+                    if create_sensor is not None:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Entität %s ist ein Sensor vom Typ '%s'", colored(sensor_id, "blue"), entity_type)
                         if not error_in_setup:
-                            if not self._create_binary_sensor(sensor_id, sensor_config):
+                            if not create_sensor(sensor_id, sensor_config):
                                 logger.warning("Fehler bei Einrichten des Sensors " + colored(sensor_id, "blue"))
                                 return False
 
@@ -60,10 +70,13 @@ class IOController:
             # Aktoren erstellen
             if 'actors' in config:
                 for actor_id, actor_config in config['actors'].items():
-                    if actor_config.get('entity_type') == 'switch':
-                        logger.debug("Entität " + colored(actor_id, "magenta") + f" ist ein Aktor vom Typ '{actor_config.get('entity_type')}'")
+                    entity_type = actor_config['entity_type']
+                    create_actor = self._actor_factories.get(entity_type)
+                    if create_actor is not None:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Entität %s ist ein Aktor vom Typ '%s'", colored(actor_id, "magenta"), entity_type)
                         if not error_in_setup:
-                            if not self._create_switch(actor_id, actor_config):
+                            if not create_actor(actor_id, actor_config):
                                 logger.warning("Fehler bei Einrichten des Aktors " + colored(actor_id, "magenta"))
                                 return False
             
@@ -82,7 +95,7 @@ class IOController:
         sensor = IOSensor(
             pin=config['pin'],
             type=config['entity_type'],
-            inverted=config.get('inverted', False),
+            inverted=config['inverted'],
             name=sensor_id,
             device_class=config.get('device_class', '')
         )
@@ -108,13 +121,13 @@ class IOController:
         actor = IOActor(
             pin=config['pin'],
             type=config['entity_type'],
-            inverted=config.get('inverted', False),
+            inverted=config['inverted'],
             name=actor_id,
             device_class=config.get('device_class', '')
         )
         
         # Automatische Rückstellung konfigurieren
-        if config.get('auto_reset', False) and 'reset_delay' in config:
+        if config['auto_reset'] and config['reset_delay'] > 0:
             actor.set_auto_reset(float(config['reset_delay']))
         
         # Initialen Zustand setzen
@@ -137,7 +150,7 @@ class IOController:
         if not self.setup_entities():
             return False
         
-        self.running = True
+        self.stop_event.clear()
         logger.info("IOController erfolgreich gestartet.")
 
         if self.mqtt_client and self.mqtt_client.connected:
@@ -178,7 +191,7 @@ class IOController:
                 # Auto-Discovery Nachricht für Sensor veröffentlichen
                 discovery_topic = f"{discovery_prefix}/binary_sensor/{node_id}/{sensor_id}/config"
                 self.mqtt_client.publish(discovery_topic, json.dumps(sensor_config), retain=True, skip_prefix=True)
-                logger.debug(f"Auto-Discovery für Sensor {sensor_id} veröffentlicht: {discovery_topic}")
+                logger.debug("Auto-Discovery für Sensor %s veröffentlicht: %s", sensor_id, discovery_topic)
             
             # Auto-Discovery für Aktoren
             for actor_id, actor in self.actors.items():
@@ -210,7 +223,7 @@ class IOController:
                 # Auto-Discovery Nachricht für Aktor veröffentlichen
                 discovery_topic = f"{discovery_prefix}/switch/{node_id}/{actor_id}/config"
                 self.mqtt_client.publish(discovery_topic, json.dumps(actor_config), retain=True, skip_prefix=True)
-                logger.debug(f"Auto-Discovery für Aktor {actor_id} veröffentlicht: {discovery_topic}")
+                logger.debug("Auto-Discovery für Aktor %s veröffentlicht: %s", actor_id, discovery_topic)
                 
                 # Subscribe auf Command-Topic des Aktors
                 self.mqtt_client.subscribe(f"actors/{actor_id}/set", self._handle_actor_command)
@@ -253,18 +266,20 @@ class IOController:
 
     def stop(self) -> None:
         """Stoppt den Controller und gibt alle Ressourcen frei."""
-        self.running = False
+        self.stop_event.set()
         # Alle Aktoren herunterfahren
         for actor_id, actor in self.actors.items():
             actor.shutdown()
-            state_value = "ON" if actor.state else "OFF"
-            self.mqtt_client.publish(f"actors/{actor_id}/state", state_value, retain=True)
+            if self.mqtt_client:
+                state_value = "ON" if actor.state else "OFF"
+                self.mqtt_client.publish(f"actors/{actor_id}/state", state_value, retain=True)
         
         # Alle Sensoren herunterfahren
         for sensor_id, sensor in self.sensors.items():
             sensor.shutdown()
-            state_value = "ON" if sensor.state else "OFF"
-            self.mqtt_client.publish(f"sensors/{sensor_id}/state", state_value, retain=True)
+            if self.mqtt_client:
+                state_value = "ON" if sensor.state else "OFF"
+                self.mqtt_client.publish(f"sensors/{sensor_id}/state", state_value, retain=True)
         
         if self.mqtt_client and self.mqtt_client.connected:
             self.mqtt_client.publish("status", "offline", retain=True)
@@ -272,6 +287,11 @@ class IOController:
 
         logger.info("IOController gestoppt.")
     
+    @property
+    def running(self) -> bool:
+        """Gibt an, ob der Controller läuft."""
+        return not self.stop_event.is_set()
+
     # Rest der Methoden bleibt unverändert...
     def update(self) -> None:
         """Aktualisiert alle Geräte - sollte in einer Schleife aufgerufen werden."""
@@ -6,10 +6,11 @@ from mcp2221_io.new_core import get_logger
 
 
 # Hardware-spezifische Importe
-if const.HW == const.MCP2221:
+_HW = const.current_hardware().hw
+if _HW is const.HW.MCP2221:
     import digitalio
     import board
-elif const.HW == const.FT232H:
+elif _HW is const.HW.FT232H:
     # Hier könnten FT232H-spezifische Importe erfolgen
     # z.B. import adafruit_blinka
     pass
@@ -31,7 +32,7 @@ class IODevice:
     _state: bool = False
     _state_raw: bool = False
     _type: str = None
-    _hw: int = None
+    _hw: const.HW = None
     _hw_applied = False
 
     def __init__(self, pin: str, type: str, inverted: bool = False, name: str = "No Name Given", device_class: str = ""):
@@ -42,7 +43,7 @@ class IODevice:
         self._state: bool = False
         self._state_raw: bool = False
         self._type: str = type
-        self._hw = const.HW
+        self._hw = _HW
 
         if self._hw == const.MCP2221:
             self._gpio_pin = getattr(board, self._pin)
@@ -100,9 +101,9 @@ class IODevice:
 
     @property
     def state_changed(self) -> bool:
-        logger.debug(f"Status von {self.name}:")
-        logger.debug(f"    - State: {self._state}")
-        logger.debug(f"    - Last State: {self._last_state}")
+        logger.debug("Status von %s:", self.name)
+        logger.debug("    - State: %s", self._state)
+        logger.debug("    - Last State: %s", self._last_state)
         return True if not self._state == self._last_state else False
 
     def sync_state(self) -> None:
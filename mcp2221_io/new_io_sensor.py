@@ -1,5 +1,6 @@
 import mcp2221_io.const as const
 
+import logging
 import time
 from termcolor import colored
 # import digitalio
@@ -8,10 +9,11 @@ from mcp2221_io.new_core import get_logger
 from mcp2221_io.new_io_device import IODevice
 
 # Hardware-spezifische Importe
-if const.HW == const.MCP2221:
+_HW = const.current_hardware().hw
+if _HW is const.HW.MCP2221:
     import digitalio
     import board
-elif const.HW == const.FT232H:
+elif _HW is const.HW.FT232H:
     # Hier könnten FT232H-spezifische Importe erfolgen
     # z.B. import adafruit_blinka
     pass
@@ -39,16 +41,19 @@ class IOSensor(IODevice):
         else:
             return False
 
-        logger.debug(f"Sensor " + colored(self.name, 'blue') +" wurde konfiguriert als INPUT")
-        logger.debug("Pin-Status vor 'sync_state():'")
-        logger.debug(f"     Raw-State: {self.state_raw}")
-        logger.debug(f"     State: {self.state}")
-        logger.debug(f"     Last-State: {self._last_state}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Sensor %s wurde konfiguriert als INPUT", colored(self.name, 'blue'))
+            logger.debug("Pin-Status vor 'sync_state():'")
+            logger.debug("     Raw-State: %s", self.state_raw)
+            logger.debug("     State: %s", self.state)
+            logger.debug("     Last-State: %s", self._last_state)
         self.sync_state()
-        logger.debug("Pin-Status nach 'sync_state():'")
-        logger.debug(f"     Raw-State: {self.state_raw}")
-        logger.debug(f"     State: {self.state}")
-        logger.debug(f"     Last-State: {self._last_state}")
+        if debug:
+            logger.debug("Pin-Status nach 'sync_state():'")
+            logger.debug("     Raw-State: %s", self.state_raw)
+            logger.debug("     State: %s", self.state)
+            logger.debug("     Last-State: %s", self._last_state)
 
     def set_debounce_time(self, new_time: float):
         """"Setzt Entprell-Zeit des Sensors"""
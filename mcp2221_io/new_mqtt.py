@@ -1,6 +1,7 @@
 # mcp2221_io/new_mqtt.py
 
 import paho.mqtt.client as mqtt
+import logging
 import time
 import json
 from termcolor import colored
@@ -55,6 +56,8 @@ class MQTTClient:
         self.connected = False
         self.last_connection_attempt = 0
         self.subscriptions = {}  # Topic -> Callback-Funktion
+        self._last_publish_info = None  # MQTTMessageInfo der zuletzt veröffentlichten Nachricht
+        self.disconnect_timeout = timeouts.get("disconnect", 0.5)
         
         logger.info(colored("MQTT-Client wurde initialisiert und konfiguriert.", 'cyan'))
 
@@ -108,6 +111,8 @@ class MQTTClient:
         if self.connected:
             logger.debug(colored("Verbindung zum MQTT-Broker wird getrennt", 'cyan'))
             try:
+                # Zuvor gesammelt veröffentlichte Nachrichten (z.B. aus IOController.stop()) zustellen
+                self.flush(self.disconnect_timeout)
                 self.client.disconnect()
                 self.client.loop_stop()
                 logger.info(colored("MQTT-Verbindung getrennt", 'cyan'))
@@ -151,8 +156,10 @@ class MQTTClient:
             
             # Ergebnis prüfen
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._last_publish_info = result
                 if self.logging_config['send']:
-                    logger.debug(colored("MQTT-Nachricht veröffentlicht: " + full_topic + " = " + payload, 'cyan'))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(colored("MQTT-Nachricht veröffentlicht: " + full_topic + " = " + payload, 'cyan'))
                 return True
             else:
                 logger.error(colored("Fehler beim Veröffentlichen der MQTT-Nachricht: " + mqtt.error_string(result.rc), 'cyan'))
@@ -162,6 +169,30 @@ class MQTTClient:
             logger.error(colored("Fehler beim Veröffentlichen der MQTT-Nachricht: " + str(e), 'cyan'))
             return False
     
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wartet einmalig, bis alle bisher veröffentlichten Nachrichten versendet wurden.
+        
+        Nachrichten werden in Reihenfolge versendet, daher genügt das Warten auf die letzte.
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+            
+        Returns:
+            bool: True, wenn alle Nachrichten versendet wurden, sonst False
+        """
+        info = self._last_publish_info
+        if info is None:
+            return True
+        try:
+            info.wait_for_publish(timeout)
+        except (ValueError, RuntimeError):
+            # Nachricht nicht mehr zustellbar (z.B. Verbindung verloren)
+            return False
+        if info.is_published():
+            self._last_publish_info = None
+            return True
+        return False
+    
     def subscribe(self, topic: str, callback: Callable[[str, str], None]) -> bool:
         """Abonniert ein MQTT-Topic und registriert einen Callback.
         
@@ -189,7 +220,7 @@ class MQTTClient:
             # Ergebnis prüfen
             if result[0] == mqtt.MQTT_ERR_SUCCESS:
                 if self.logging_config['process']:
-                    logger.debug(f"MQTT-Topic abonniert: {full_topic}")
+                    logger.debug("MQTT-Topic abonniert: %s", full_topic)
                 return True
             else:
                 logger.error(colored("Fehler beim Abonnieren des MQTT-Topics: " + mqtt.error_string(result[0]), 'cyan'))
@@ -239,7 +270,8 @@ class MQTTClient:
             payload = msg.payload.decode()
             
             if self.logging_config['receive']:
-                logger.debug(colored(f"MQTT-Nachricht empfangen: {msg.topic} = {payload}", 'cyan'))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(colored(f"MQTT-Nachricht empfangen: {msg.topic} = {payload}", 'cyan'))
             
             # Prüfen, ob ein Callback für dieses Topic registriert ist
             for subscribed_topic, callback in self.subscriptions.items():
@@ -6,7 +6,6 @@ import time
 import sys
 import os
 import logging
-from datetime import datetime
 
 # Füge das Projektverzeichnis zum Suchpfad hinzu
 project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -28,12 +27,20 @@ def main():
     closed_pin = digitalio.DigitalInOut(board.G3)
     closed_pin.direction = digitalio.Direction.INPUT
     
+    # Zeitstempel nur neu formatieren, wenn sich die Sekunde geändert hat
+    last_sec = -1
+    timestamp = ""
+    next_tick = time.monotonic()
+    samples = 0
     try:
         while True:
             open_value = open_pin.value
             closed_value = closed_pin.value
             
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            sec = int(time.time())
+            if sec != last_sec:
+                last_sec = sec
+                timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
             
             # Status ausgeben
             status_line = f"[{timestamp}] SENSOR STATUS: open={open_value}, closed={closed_value} | "
@@ -48,12 +55,24 @@ def main():
             elif open_value and closed_value:
                 status_line += "ZUSTAND: UNGÜLTIG (beide Sensoren aktiv)"
             
-            print(status_line)
-            time.sleep(1)
+            # Ausgabe gepuffert schreiben, Flush nur alle 5 Messungen
+            sys.stdout.write(status_line + "\n")
+            samples += 1
+            if samples % 5 == 0:
+                sys.stdout.flush()
+            
+            # Fester 1-Sekunden-Takt: Laufzeit der Iteration wird von der Wartezeit abgezogen
+            next_tick += 1.0
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Überlauf: Takt neu ansetzen statt aufzuholen
             
     except KeyboardInterrupt:
         print("\nDiagnostik beendet.")
     finally:
+        sys.stdout.flush()
         # Pins aufräumen
         open_pin.deinit()
         closed_pin.deinit()